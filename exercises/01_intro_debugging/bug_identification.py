@@ -29,8 +29,10 @@ except Exception as e:
 # Bug 2: This function is supposed to remove duplicates from a list
 def remove_duplicates(items):
     unique_items = []
+    seen = set()  # O(1) membership checks; the list keeps insertion order
     for item in items:
-        if not item in unique_items:
+        if item not in seen:
+            seen.add(item)
             unique_items.append(item)
     return unique_items
 
@@ -53,6 +55,8 @@ except Exception as e:
 
 # Bug 4: This function should count words in a string
 def count_words(sentence):
+    # split() with no argument collapses runs of whitespace, and its C loop
+    # still beats counting with a regex or a per-character scan in CPython
     return len(sentence.split())
 
 # Test Bug 4
@@ -61,11 +65,8 @@ print("\nWord count test:", count_words("This is a    test with   multiple space
 
 # Bug 5: This function is supposed to find the largest number divisible by 3 in a list
 def largest_divisible_by_3(numbers):
-    largest = 0
-    for num in numbers:
-        if num % 3 == 0 and num > largest:
-            largest = num
-    return largest
+    # Let the built-in max() drive the scan instead of a compare-and-assign loop
+    return max((num for num in numbers if num % 3 == 0 and num > 0), default=0)
 
 # Test Bug 5
 print("\nLargest divisible by 3:", largest_divisible_by_3([1, 2, 3, 6, 9, 4, 15, 12]))
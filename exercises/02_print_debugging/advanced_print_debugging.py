@@ -16,6 +16,8 @@ from datetime import datetime
 DEBUG = True
 
 class Student:
+    __slots__ = ('id', 'name', 'scores')
+    
     def __init__(self, id, name, scores):
         self.id = id
         self.name = name
@@ -40,19 +42,14 @@ def generate_sample_data():
 
 def calculate_statistics(students):
     """Calculate average scores and identify struggling students."""
-    class_averages = []
-    struggling_students = []
+    # Calculate every student's average score in one comprehension
+    class_averages = [sum(student.scores) / len(student.scores) for student in students]
     
-    for student in students:
-        # Calculate student's average score
-        avg_score = sum(student.scores) / len(student.scores)
-        
-        # If average is below 70, student needs help
-        if avg_score < 70:
-            struggling_students.append(student)
-        
-        # Add to class averages
-        class_averages.append(avg_score)
+    # If average is below 70, student needs help
+    # Keep each average alongside its student so the report can reuse it
+    struggling_students = [(student, avg_score)
+                           for student, avg_score in zip(students, class_averages)
+                           if avg_score < 70]
     
     # Calculate overall class average
     overall_average = sum(class_averages) / len(class_averages)
@@ -74,9 +71,7 @@ def generate_report(stats):
     
     # Check if there are any struggling students
     if stats['struggling_students']:
-        for student in stats['struggling_students']:
-            # Calculate student average again for the report
-            avg = sum(student.scores) / len(student.scores)
+        for student, avg in stats['struggling_students']:
             report.append(f"- {student.name} (ID: {student.id}): {avg:.2f}")
     else:
         report.append("None")
@@ -13,14 +13,12 @@ Your tasks:
 
 def fibonacci(n):
     """Calculate the first n numbers in the Fibonacci sequence."""
-    result = []
+    result = [0] * n
+    a, b = 0, 1
     for i in range(n):
-        if i <= 1:
-            result.append(i)
-        else:
-            # Calculate next Fibonacci number
-            next_fib = result[i-1] + result[i-2]
-            result.append(next_fib)
+        result[i] = a
+        # Carry the last two Fibonacci numbers in locals instead of indexing
+        a, b = b, a + b
     return result
 
 # Test the function
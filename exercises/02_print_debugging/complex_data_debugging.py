@@ -10,9 +10,14 @@ containing information about books in a library. The code attempts to transform
 data for use in a library management system but contains bugs.
 """
 
-import json
 from pprint import pprint
 
+# Use the faster orjson parser when it's installed; the stdlib json module otherwise
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Sample API response data
 API_RESPONSE = '''
 {
@@ -62,7 +67,7 @@ API_RESPONSE = '''
 
 def parse_library_data(api_response):
     """Parse the API response and return structured library data."""
-    data = json.loads(api_response)
+    data = json_loads(api_response)
     library = data['library']
     
     result = {
@@ -76,8 +81,7 @@ def parse_library_data(api_response):
     # Process each book
     for book in library['books']:
         # Add categories to our set
-        for category in book['categories']:
-            result['categories'].add(category)
+        result['categories'].update(book['categories'])
         
         # Process book based on availability
         if book['available']:
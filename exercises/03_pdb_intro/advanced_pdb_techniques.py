@@ -15,14 +15,20 @@ Objectives:
 import random
 from datetime import datetime, timedelta
 
+# Bound once so the hot sort and date checks skip the attribute lookups
+_FAR_FUTURE = datetime.max  # Sorts tasks without a deadline last
+_NOW = datetime.now
+
 class Task:
+    __slots__ = ('id', 'name', 'priority', 'deadline', 'completed', 'created_at')
+    
     def __init__(self, id, name, priority, deadline=None, completed=False):
         self.id = id
         self.name = name
         self.priority = priority  # 1 (highest) to 5 (lowest)
         self.deadline = deadline
         self.completed = completed
-        self.created_at = datetime.now()
+        self.created_at = _NOW()
     
     def __repr__(self):
         deadline_str = f", due: {self.deadline.strftime('%Y-%m-%d')}" if self.deadline else ""
@@ -34,20 +40,19 @@ class TaskManager:
     def __init__(self):
         self.tasks = []
         self.last_id = 0
+        self._by_id = {}  # Mirrors self.tasks for O(1) lookups by ID
     
     def add_task(self, name, priority=3, deadline=None):
         """Add a new task to the manager."""
         self.last_id += 1
         task = Task(self.last_id, name, priority, deadline)
         self.tasks.append(task)
+        self._by_id[task.id] = task
         return task
     
     def get_task(self, task_id):
         """Get a task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
     
     def complete_task(self, task_id):
         """Mark a task as completed."""
@@ -62,12 +67,13 @@ class TaskManager:
         task = self.get_task(task_id)
         if task:
             self.tasks.remove(task)
+            del self._by_id[task_id]
             return True
         return False
     
     def get_overdue_tasks(self):
         """Get all tasks that are past their deadline and not completed."""
-        today = datetime.now().date()
+        today = _NOW().date()
         overdue = []
         
         for task in self.tasks:
@@ -78,7 +84,7 @@ class TaskManager:
     
     def get_upcoming_tasks(self, days=7):
         """Get tasks due in the next X days."""
-        today = datetime.now().date()
+        today = _NOW().date()
         end_date = today + timedelta(days=days)
         upcoming = []
         
@@ -97,28 +103,27 @@ class TaskManager:
     def sort_tasks(self, key="priority"):
         """Sort tasks by the given key (priority, deadline, or creation date)."""
         if key == "priority":
-            # Sort by priority (ascending), then by deadline (ascending, with None at the end)
-            def priority_key(task):
-                # Return a tuple for sorting (completed, priority, deadline)
-                deadline_val = task.deadline or datetime.max
-                return (task.completed, task.priority, deadline_val)
-            
-            self.tasks.sort(key=priority_key)
+            # Sort by priority (ascending), then by deadline (ascending, with None at the end).
+            # Decorate-sort-undecorate: build the (completed, priority, deadline) keys in one
+            # comprehension; the index breaks ties so Task objects are never compared.
+            decorated = [((task.completed, task.priority, task.deadline or _FAR_FUTURE), i, task)
+                         for i, task in enumerate(self.tasks)]
+            decorated.sort()
+            self.tasks = [task for _, _, task in decorated]
             
         elif key == "deadline":
-            # Sort by deadline (ascending), with None at the end
-            def deadline_key(task):
-                # Return a tuple for sorting (completed, has_deadline, deadline)
-                has_deadline = 0 if task.deadline else 1
-                deadline_val = task.deadline or datetime.max
-                return (task.completed, has_deadline, deadline_val)
-            
-            self.tasks.sort(key=deadline_key)
+            # Sort by deadline (ascending), with None at the end,
+            # using (completed, has_deadline, deadline) keys
+            decorated = [((task.completed, 0 if task.deadline else 1, task.deadline or _FAR_FUTURE),
+                          i, task)
+                         for i, task in enumerate(self.tasks)]
+            decorated.sort()
+            self.tasks = [task for _, _, task in decorated]
             
         elif key == "created":
             # Sort by creation date (ascending)
             self.tasks.sort(key=lambda task: (task.completed, task.created_at))
-            
+        
         return self.tasks
 
 
@@ -147,16 +152,16 @@ def create_sample_tasks():
 
 def generate_task_report(manager, include_completed=False):
     """Generate a report of tasks."""
+    today = _NOW().date()
     report = []
     report.append("TASK REPORT")
     report.append("=" * 50)
     report.append(f"Total Tasks: {len(manager.tasks)}")
     
     # Count completed and incomplete tasks
-    completed_tasks = [task for task in manager.tasks if task.completed]
-    incomplete_tasks = [task for task in manager.tasks if not task.completed]
-    report.append(f"Completed: {len(completed_tasks)}")
-    report.append(f"Incomplete: {len(incomplete_tasks)}")
+    completed_count = sum(1 for task in manager.tasks if task.completed)
+    report.append(f"Completed: {completed_count}")
+    report.append(f"Incomplete: {len(manager.tasks) - completed_count}")
     
     # Check for overdue tasks
     overdue_tasks = manager.get_overdue_tasks()
@@ -181,11 +186,11 @@ def generate_task_report(manager, include_completed=False):
     for task in sorted_tasks:
         if not task.completed:
             deadline_str = f" (Due: {task.deadline.strftime('%Y-%m-%d')})" if task.deadline else ""
-            overdue_marker = " - OVERDUE!" if task.deadline and task.deadline.date() < datetime.now().date() else ""
+            overdue_marker = " - OVERDUE!" if task.deadline and task.deadline.date() < today else ""
             report.append(f"[P{task.priority}] {task.name}{deadline_str}{overdue_marker}")
     
     # Then list completed tasks if requested
-    if include_completed and completed_tasks:
+    if include_completed and completed_count:
         report.append("\nCOMPLETED TASKS:")
         for task in sorted_tasks:
             if task.completed:
@@ -194,6 +199,142 @@ def generate_task_report(manager, include_completed=False):
     return "\n".join(report)
 
 
+# Filters accepted by the list command, mapped to the tasks they select
+LIST_FILTERS = {
+    "all": lambda manager: manager.tasks,
+    "overdue": TaskManager.get_overdue_tasks,
+    "upcoming": TaskManager.get_upcoming_tasks,
+    "high": TaskManager.get_high_priority_tasks,
+}
+
+VALID_SORT_KEYS = frozenset({"priority", "deadline", "created"})
+
+
+def _handle_add(manager, args):
+    """Handle: add "Task name" [priority] [deadline]"""
+    if not args:
+        return "Error: Task name required."
+    
+    # Extract task name (may be in quotes)
+    name_parts = []
+    in_quotes = False
+    name_end_idx = 0
+    
+    for i, part in enumerate(args):
+        if part.startswith('"') and not in_quotes:
+            in_quotes = True
+            name_parts.append(part.strip('"'))
+        elif part.endswith('"') and in_quotes:
+            in_quotes = False
+            name_parts.append(part.strip('"'))
+            name_end_idx = i
+            break
+        elif in_quotes:
+            name_parts.append(part)
+        
+    name = " ".join(name_parts)
+    
+    # Parse priority and deadline if provided
+    priority = 3  # Default priority
+    deadline = None
+    
+    if len(args) > name_end_idx + 1:
+        try:
+            priority = int(args[name_end_idx + 1])
+            if priority < 1 or priority > 5:
+                return "Error: Priority must be 1-5."
+        except ValueError:
+            return "Error: Invalid priority."
+    
+    if len(args) > name_end_idx + 2:
+        try:
+            deadline = datetime.strptime(args[name_end_idx + 2], "%Y-%m-%d")
+        except ValueError:
+            return "Error: Invalid deadline format. Use YYYY-MM-DD."
+    
+    task = manager.add_task(name, priority, deadline)
+    return f"Added: {task}"
+
+
+def _handle_complete(manager, args):
+    """Handle: complete [task_id]"""
+    if not args:
+        return "Error: Task ID required."
+    
+    try:
+        task_id = int(args[0])
+    except ValueError:
+        return "Error: Invalid task ID."
+    
+    if manager.complete_task(task_id):
+        return f"Marked task {task_id} as completed."
+    else:
+        return f"Error: Task {task_id} not found."
+
+
+def _handle_delete(manager, args):
+    """Handle: delete [task_id]"""
+    if not args:
+        return "Error: Task ID required."
+    
+    try:
+        task_id = int(args[0])
+    except ValueError:
+        return "Error: Invalid task ID."
+    
+    if manager.delete_task(task_id):
+        return f"Deleted task {task_id}."
+    else:
+        return f"Error: Task {task_id} not found."
+
+
+def _handle_list(manager, args):
+    """Handle: list [all|overdue|upcoming|high]"""
+    filter_type = args[0].lower() if args else "all"
+    
+    get_tasks = LIST_FILTERS.get(filter_type)
+    if get_tasks is None:
+        return f"Error: Unknown filter type '{filter_type}'."
+    tasks = get_tasks(manager)
+    
+    if not tasks:
+        return "No tasks found."
+    
+    return "\n".join(str(task) for task in tasks)
+
+
+def _handle_sort(manager, args):
+    """Handle: sort [priority|deadline|created]"""
+    sort_key = args[0].lower() if args else "priority"
+    
+    if sort_key not in VALID_SORT_KEYS:
+        return f"Error: Unknown sort key '{sort_key}'."
+    
+    tasks = manager.sort_tasks(sort_key)
+    
+    if not tasks:
+        return "No tasks found."
+    
+    return "\n".join(str(task) for task in tasks)
+
+
+def _handle_report(manager, args):
+    """Handle: report [all]"""
+    include_completed = bool(args) and args[0].lower() == "all"
+    return generate_task_report(manager, include_completed)
+
+
+# Maps each command name to the function that handles it
+COMMAND_HANDLERS = {
+    "add": _handle_add,
+    "complete": _handle_complete,
+    "delete": _handle_delete,
+    "list": _handle_list,
+    "sort": _handle_sort,
+    "report": _handle_report,
+}
+
+
 def process_command(manager, command):
     """Process a user command for the task manager."""
     parts = command.split()
@@ -202,136 +343,12 @@ def process_command(manager, command):
         return "No command provided."
     
     action = parts[0].lower()
+    handler = COMMAND_HANDLERS.get(action)
+    if handler is None:
+        return f"Error: Unknown command '{action}'."
     
     try:
-        if action == "add":
-            # Format: add "Task name" [priority] [deadline]
-            if len(parts) < 2:
-                return "Error: Task name required."
-            
-            # Extract task name (may be in quotes)
-            name_parts = []
-            in_quotes = False
-            name_end_idx = 1
-            
-            for i, part in enumerate(parts[1:], 1):
-                if part.startswith('"') and not in_quotes:
-                    in_quotes = True
-                    name_parts.append(part.strip('"'))
-                elif part.endswith('"') and in_quotes:
-                    in_quotes = False
-                    name_parts.append(part.strip('"'))
-                    name_end_idx = i
-                    break
-                elif in_quotes:
-                    name_parts.append(part)
-                
-            name = " ".join(name_parts)
-            
-            # Parse priority and deadline if provided
-            priority = 3  # Default priority
-            deadline = None
-            
-            if len(parts) > name_end_idx + 1:
-                try:
-                    priority = int(parts[name_end_idx + 1])
-                    if priority < 1 or priority > 5:
-                        return "Error: Priority must be 1-5."
-                except ValueError:
-                    return "Error: Invalid priority."
-            
-            if len(parts) > name_end_idx + 2:
-                try:
-                    deadline = datetime.strptime(parts[name_end_idx + 2], "%Y-%m-%d")
-                except ValueError:
-                    return "Error: Invalid deadline format. Use YYYY-MM-DD."
-            
-            task = manager.add_task(name, priority, deadline)
-            return f"Added: {task}"
-            
-        elif action == "complete":
-            # Format: complete [task_id]
-            if len(parts) < 2:
-                return "Error: Task ID required."
-            
-            try:
-                task_id = int(parts[1])
-            except ValueError:
-                return "Error: Invalid task ID."
-            
-            if manager.complete_task(task_id):
-                return f"Marked task {task_id} as completed."
-            else:
-                return f"Error: Task {task_id} not found."
-                
-        elif action == "delete":
-            # Format: delete [task_id]
-            if len(parts) < 2:
-                return "Error: Task ID required."
-            
-            try:
-                task_id = int(parts[1])
-            except ValueError:
-                return "Error: Invalid task ID."
-            
-            if manager.delete_task(task_id):
-                return f"Deleted task {task_id}."
-            else:
-                return f"Error: Task {task_id} not found."
-                
-        elif action == "list":
-            # Format: list [all|overdue|upcoming|high]
-            filter_type = parts[1].lower() if len(parts) > 1 else "all"
-            
-            if filter_type == "all":
-                tasks = manager.tasks
-            elif filter_type == "overdue":
-                tasks = manager.get_overdue_tasks()
-            elif filter_type == "upcoming":
-                tasks = manager.get_upcoming_tasks()
-            elif filter_type == "high":
-                tasks = manager.get_high_priority_tasks()
-            else:
-                return f"Error: Unknown filter type '{filter_type}'."
-            
-            if not tasks:
-                return "No tasks found."
-            
-            result = []
-            for task in tasks:
-                result.append(str(task))
-            
-            return "\n".join(result)
-            
-        elif action == "sort":
-            # Format: sort [priority|deadline|created]
-            sort_key = parts[1].lower() if len(parts) > 1 else "priority"
-            
-            if sort_key not in ["priority", "deadline", "created"]:
-                return f"Error: Unknown sort key '{sort_key}'."
-            
-            tasks = manager.sort_tasks(sort_key)
-            
-            if not tasks:
-                return "No tasks found."
-            
-            result = []
-            for task in tasks:
-                result.append(str(task))
-            
-            return "\n".join(result)
-            
-        elif action == "report":
-            # Format: report [include_completed]
-            include_completed = False
-            if len(parts) > 1 and parts[1].lower() == "all":
-                include_completed = True
-            
-            return generate_task_report(manager, include_completed)
-            
-        else:
-            return f"Error: Unknown command '{action}'."
-            
+        return handler(manager, parts[1:])
     except Exception as e:
         # This is a bug! We should handle specific exceptions, not catch all.
         # Use post-mortem debugging to investigate when this happens.
@@ -11,6 +11,10 @@ Objectives:
 - Find and fix logical errors using the debugger
 """
 
+# Receipt separator line, built once rather than on every call
+RECEIPT_SEPARATOR = "-" * 40
+
+
 def calculate_discounted_price(prices, discount_percentage):
     """
     Calculate the discounted price for each item in the prices list.
@@ -25,21 +29,8 @@ def calculate_discounted_price(prices, discount_percentage):
     if discount_percentage < 0 or discount_percentage > 100:
         raise ValueError("Discount percentage must be between 0 and 100")
     
-    discounted_prices = []
-    
-    for price in prices:
-        # Calculate discount amount
-        discount_amount = price * discount_percentage / 100
-        
-        # Apply discount
-        discounted_price = price - discount_amount
-        
-        # Round to 2 decimal places
-        discounted_price = round(discounted_price, 2)
-        
-        discounted_prices.append(discounted_price)
-    
-    return discounted_prices
+    # Apply the discount and round to 2 decimal places in a single comprehension
+    return [round(price - price * discount_percentage / 100, 2) for price in prices]
 
 
 def calculate_total(prices):
@@ -52,12 +43,7 @@ def calculate_total(prices):
     Returns:
         Total price
     """
-    total = 0
-    
-    for price in prices:
-        total += price
-    
-    return total
+    return sum(prices)
 
 
 def generate_receipt(items, prices, discount_percentage=0):
@@ -75,6 +61,11 @@ def generate_receipt(items, prices, discount_percentage=0):
     if len(items) != len(prices):
         raise ValueError("Items and prices must have the same length")
     
+    # Fast path: without a discount there is nothing to compute per item
+    if discount_percentage == 0:
+        items_block = "".join(f"{item}: ${price:.2f}\n" for item, price in zip(items, prices))
+        return f"RECEIPT\n{RECEIPT_SEPARATOR}\n{items_block}{RECEIPT_SEPARATOR}\nTotal: ${calculate_total(prices):.2f}"
+    
     # Calculate discounted prices
     discounted_prices = calculate_discounted_price(prices, discount_percentage)
     
@@ -82,35 +73,17 @@ def generate_receipt(items, prices, discount_percentage=0):
     original_total = calculate_total(prices)
     discounted_total = calculate_total(discounted_prices)
     
-    # Build receipt
-    receipt = []
-    receipt.append("RECEIPT")
-    receipt.append("-" * 40)
-    
-    # Add items
-    for i in range(len(items)):
-        item = items[i]
-        original_price = prices[i]
-        discounted_price = discounted_prices[i]
-        
-        if discount_percentage > 0:
-            receipt.append(f"{item}: ${original_price:.2f} -> ${discounted_price:.2f}")
-        else:
-            receipt.append(f"{item}: ${original_price:.2f}")
-    
-    receipt.append("-" * 40)
-    
-    # Add totals
-    if discount_percentage > 0:
-        savings = original_total - discounted_total
-        receipt.append(f"Original Total: ${original_total:.2f}")
-        receipt.append(f"Discount: {discount_percentage}%")
-        receipt.append(f"You Save: ${savings:.2f}")
-        receipt.append(f"Final Total: ${discounted_total:.2f}")
-    else:
-        receipt.append(f"Total: ${original_total:.2f}")
+    savings = original_total - discounted_total
+    totals = (f"Original Total: ${original_total:.2f}\n"
+              f"Discount: {discount_percentage}%\n"
+              f"You Save: ${savings:.2f}\n"
+              f"Final Total: ${discounted_total:.2f}")
     
-    return "\n".join(receipt)
+    # Assemble the receipt from a fixed template
+    items_block = "".join(f"{item}: ${original_price:.2f} -> ${discounted_price:.2f}\n"
+                          for item, original_price, discounted_price
+                          in zip(items, prices, discounted_prices))
+    return f"RECEIPT\n{RECEIPT_SEPARATOR}\n{items_block}{RECEIPT_SEPARATOR}\n{totals}"
 
 
 # Test Case 1: No discount
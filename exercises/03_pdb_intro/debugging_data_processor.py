@@ -16,10 +16,54 @@ Objectives:
 import csv
 import os
 import datetime
-import statistics
+import math
 from pathlib import Path
 
 
+def _is_number(value):
+    """Check whether a CSV cell is something float() can convert."""
+    if not value:
+        return False
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _median(values):
+    """Return the median of a non-empty list of numbers."""
+    sorted_values = sorted(values)
+    middle = len(sorted_values) // 2
+    if len(sorted_values) % 2 == 0:
+        return (sorted_values[middle - 1] + sorted_values[middle]) / 2
+    return sorted_values[middle]
+
+
+def _column_statistics(values):
+    """Calculate summary statistics for one non-empty column of numbers."""
+    # Calculate basic statistics, summing the values only once
+    total = sum(values)
+    count = len(values)
+    avg = total / count
+    stats = {
+        "min": min(values),
+        "max": max(values),
+        "avg": avg,
+        "median": _median(values),
+        "sum": total,
+        "count": count
+    }
+    
+    # Calculate standard deviation if there are enough values,
+    # reusing the mean rather than recomputing it
+    if count > 1:
+        variance = sum((value - avg) * (value - avg) for value in values) / (count - 1)
+        stats["std_dev"] = math.sqrt(variance)
+    
+    return stats
+
+
 class DataProcessor:
     def __init__(self, data_dir="data"):
         self.data_dir = data_dir
@@ -30,9 +74,11 @@ class DataProcessor:
     def scan_data_directory(self):
         """Scan the data directory for CSV files."""
         try:
-            # Get all CSV files in the data directory
-            path = Path(self.data_dir)
-            self.data_files = list(path.glob("*.csv"))
+            # Get all CSV files in the data directory; scandir avoids building
+            # a Path object for every entry
+            with os.scandir(self.data_dir) as entries:
+                self.data_files = [entry.path for entry in entries
+                                   if entry.name.endswith(".csv") and entry.is_file()]
             
             if not self.data_files:
                 print(f"No CSV files found in {self.data_dir}")
@@ -45,28 +91,45 @@ class DataProcessor:
             return 0
     
     def read_data_file(self, file_path):
-        """Read and parse a CSV data file."""
+        """Read and parse a CSV data file, returning its rows and numeric columns."""
         try:
             data = []
+            numeric_columns = []
+            columns = {}  # Column index -> list of that column's values
             with open(file_path, 'r', newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if header is None:
+                    return data, {}
+                
+                first_row = True
                 for row in reader:
-                    # Convert string values to appropriate types
-                    processed_row = {}
-                    for key, value in row.items():
-                        # Try to convert to float if it's numeric
+                    # Like DictReader, pad short rows with None
+                    if len(row) < len(header):
+                        row += [None] * (len(header) - len(row))
+                    
+                    # Work out which columns are numeric from the first record only,
+                    # so later rows never send string columns through a failing float() call
+                    if first_row:
+                        numeric_columns = [i for i, value in enumerate(row) if _is_number(value)]
+                        columns = {i: [] for i in numeric_columns}
+                        first_row = False
+                    
+                    # Convert the numeric columns and collect them column-wise for analysis
+                    for i in numeric_columns:
                         try:
-                            processed_row[key] = float(value)
+                            row[i] = float(row[i])
                         except ValueError:
                             # If not numeric, keep as string
-                            processed_row[key] = value
+                            pass
+                        columns[i].append(row[i])
                     
-                    data.append(processed_row)
+                    data.append(dict(zip(header, row)))
             
-            return data
+            return data, {header[i]: columns[i] for i in numeric_columns}
         except Exception as e:
             print(f"Error reading file {file_path}: {e}")
-            return []
+            return [], {}
     
     def process_all_files(self):
         """Process all data files."""
@@ -75,12 +138,13 @@ class DataProcessor:
         
         for file_path in self.data_files:
             print(f"Processing {file_path}...")
-            data = self.read_data_file(file_path)
+            data, columns = self.read_data_file(file_path)
             
             if data:
-                # Use the filename (without extension) as the key
-                key = file_path.stem
-                self.processed_data[key] = data
+                # Use the filename (without extension) as the key, and keep the
+                # numeric columns built while reading so analysis can use them directly
+                key = os.path.splitext(os.path.basename(file_path))[0]
+                self.processed_data[key] = {"rows": data, "columns": columns}
                 print(f"Successfully processed {len(data)} records from {key}")
             else:
                 print(f"No data processed from {file_path}")
@@ -95,7 +159,9 @@ class DataProcessor:
         
         print("Analyzing data...")
         
-        for dataset_name, data in self.processed_data.items():
+        for dataset_name, dataset in self.processed_data.items():
+            data = dataset["rows"]
+            
             # Initialize analysis results for this dataset
             self.analysis_results[dataset_name] = {
                 "record_count": len(data),
@@ -107,35 +173,13 @@ class DataProcessor:
             if not data:
                 continue
             
-            # Get all numeric fields from the first record
-            numeric_fields = []
-            for field, value in data[0].items():
-                if isinstance(value, (int, float)):
-                    numeric_fields.append(field)
-            
             # Calculate statistics for each numeric field
-            for field in numeric_fields:
-                values = [record[field] for record in data if field in record]
-                
+            for field, values in dataset["columns"].items():
                 if not values:
                     continue
                 
-                # Calculate basic statistics
                 try:
-                    stats = {
-                        "min": min(values),
-                        "max": max(values),
-                        "avg": sum(values) / len(values),
-                        "median": statistics.median(values),
-                        "sum": sum(values),
-                        "count": len(values)
-                    }
-                    
-                    # Calculate standard deviation if there are enough values
-                    if len(values) > 1:
-                        stats["std_dev"] = statistics.stdev(values)
-                    
-                    self.analysis_results[dataset_name]["fields"][field] = stats
+                    self.analysis_results[dataset_name]["fields"][field] = _column_statistics(values)
                 except Exception as e:
                     print(f"Error calculating statistics for {field}: {e}")
         
@@ -148,33 +192,37 @@ class DataProcessor:
             return False
         
         try:
-            with open(output_file, 'w') as f:
-                f.write("DATA ANALYSIS REPORT\n")
-                f.write("===================\n\n")
-                f.write(f"Generated: {datetime.datetime.now()}\n")
-                f.write(f"Datasets analyzed: {len(self.analysis_results)}\n\n")
+            # Build the whole report in memory and write it with a single call
+            parts = []
+            parts.append("DATA ANALYSIS REPORT\n")
+            parts.append("===================\n\n")
+            parts.append(f"Generated: {datetime.datetime.now()}\n")
+            parts.append(f"Datasets analyzed: {len(self.analysis_results)}\n\n")
+            
+            for dataset_name, results in self.analysis_results.items():
+                parts.append(f"Dataset: {dataset_name}\n")
+                parts.append(f"Records: {results['record_count']}\n")
+                parts.append(f"Analysis timestamp: {results['timestamp']}\n\n")
                 
-                for dataset_name, results in self.analysis_results.items():
-                    f.write(f"Dataset: {dataset_name}\n")
-                    f.write(f"Records: {results['record_count']}\n")
-                    f.write(f"Analysis timestamp: {results['timestamp']}\n\n")
-                    
-                    if "fields" in results and results["fields"]:
-                        f.write("Field statistics:\n")
-                        f.write("-----------------\n")
-                        
-                        for field_name, stats in results["fields"].items():
-                            f.write(f"Field: {field_name}\n")
-                            for stat_name, value in stats.items():
-                                f.write(f"  {stat_name}: {value}\n")
-                            f.write("\n")
-                    else:
-                        f.write("No field statistics available.\n\n")
+                if "fields" in results and results["fields"]:
+                    parts.append("Field statistics:\n")
+                    parts.append("-----------------\n")
                     
-                    f.write("="*50 + "\n\n")
+                    for field_name, stats in results["fields"].items():
+                        parts.append(f"Field: {field_name}\n")
+                        parts.append("".join(f"  {stat_name}: {value}\n"
+                                             for stat_name, value in stats.items()))
+                        parts.append("\n")
+                else:
+                    parts.append("No field statistics available.\n\n")
                 
-                print(f"Report generated: {output_file}")
-                return True
+                parts.append("="*50 + "\n\n")
+            
+            with open(output_file, 'w') as f:
+                f.write("".join(parts))
+            
+            print(f"Report generated: {output_file}")
+            return True
                 
         except Exception as e:
             print(f"Error generating report: {e}")
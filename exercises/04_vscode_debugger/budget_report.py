@@ -5,8 +5,20 @@ This module contains functions for generating various financial reports.
 It contains intentional bugs for the VS Code debugging exercise.
 """
 
+import heapq
 from collections import defaultdict
-from transaction import get_month_name
+from operator import attrgetter, itemgetter
+from transaction import parse_month_key
+
+# Header and summary block for each month, filled in with format_map
+MONTH_SUMMARY_TEMPLATE = (
+    "{month_title}\n"
+    "{underline}\n"
+    "Transactions: {count} ({expense_count} expenses, {income_count} income)\n"
+    "Income: ${income:.2f}\n"
+    "Expenses: ${expenses:.2f}\n"
+    "Net: ${net:.2f}\n"
+)
 
 
 def generate_monthly_report(transactions, monthly_totals, monthly_budgets):
@@ -21,29 +33,41 @@ def generate_monthly_report(transactions, monthly_totals, monthly_budgets):
     Returns:
         Formatted report string
     """
+    # Drop the last newline so the text ends like the old "\n".join() output
+    return "".join(_monthly_report_lines(transactions, monthly_totals, monthly_budgets))[:-1]
+
+
+def _monthly_report_lines(transactions, monthly_totals, monthly_budgets):
+    """Yield the lines of the monthly report, each ending in a newline."""
     if not transactions:
-        return "No transactions to report."
+        yield "No transactions to report.\n"
+        return
     
-    # Organize transactions by month
+    # Sort once by date so each month's list is already in chronological order
+    transactions = sorted(transactions, key=attrgetter('date'))
+    
+    # Organize transactions by month, counting each month's expenses as we go
     monthly_transactions = defaultdict(list)
+    expense_counts = defaultdict(int)
     for transaction in transactions:
-        monthly_transactions[transaction.month_key].append(transaction)
+        month_key = transaction.month_key
+        monthly_transactions[month_key].append(transaction)
+        if transaction.is_expense:
+            expense_counts[month_key] += 1
     
     # Generate the report
-    report = []
-    report.append("MONTHLY FINANCIAL REPORT")
-    report.append("=========================\n")
+    yield "MONTHLY FINANCIAL REPORT\n"
+    yield "=========================\n\n"
     
     # Sort months chronologically
     sorted_months = sorted(monthly_transactions.keys())
     
     for month_key in sorted_months:
-        year, month = month_key.split('-')
-        month_name = get_month_name(int(month))
+        year, month_name = parse_month_key(month_key)
         
         # Get transactions for this month
         month_transactions = monthly_transactions[month_key]
-        expense_count = sum(1 for t in month_transactions if t.is_expense)
+        expense_count = expense_counts[month_key]
         income_count = len(month_transactions) - expense_count
         
         # Get monthly totals
@@ -67,36 +91,36 @@ def generate_monthly_report(transactions, monthly_totals, monthly_budgets):
         budget_difference = budget + expenses  # Bug: should be budget - abs(expenses)
         budget_status = "under budget" if budget_difference >= 0 else "over budget"
         
-        # Add month header
-        report.append(f"{month_name} {year}")
-        report.append("-" * len(f"{month_name} {year}"))
-        
-        # Add summary statistics
-        report.append(f"Transactions: {len(month_transactions)} ({expense_count} expenses, {income_count} income)")
-        report.append(f"Income: ${income:.2f}")
-        report.append(f"Expenses: ${expenses:.2f}")  # Bug: should show positive amount
-        report.append(f"Net: ${net:.2f}")
+        # Add month header and summary statistics
+        # (Bug: the Expenses line should show a positive amount)
+        month_title = f"{month_name} {year}"
+        yield MONTH_SUMMARY_TEMPLATE.format_map({
+            "month_title": month_title,
+            "underline": "-" * len(month_title),
+            "count": len(month_transactions),
+            "expense_count": expense_count,
+            "income_count": income_count,
+            "income": income,
+            "expenses": expenses,
+            "net": net,
+        })
         
         # Add budget information
         if budget > 0:
-            report.append(f"Budget: ${budget:.2f}")
-            report.append(f"Status: ${abs(budget_difference):.2f} {budget_status}")
+            yield f"Budget: ${budget:.2f}\n"
+            yield f"Status: ${abs(budget_difference):.2f} {budget_status}\n"
         else:
-            report.append("Budget: Not set")
+            yield "Budget: Not set\n"
         
         # Add transaction details
-        report.append("\nTransactions:")
+        yield "\nTransactions:\n"
         if month_transactions:
-            for transaction in sorted(month_transactions, key=lambda t: t.date):
-                amount = transaction.amount
-                sign = "" if amount < 0 else "+"
-                report.append(f"  {transaction.date}: {sign}${abs(amount):.2f} - {transaction.category} - {transaction.description}")
+            for transaction in month_transactions:
+                yield f"  {transaction.date}: {transaction.sign_char}${transaction.abs_amount:.2f} - {transaction.category} - {transaction.description}\n"
         else:
-            report.append("  No transactions for this month.")
+            yield "  No transactions for this month.\n"
         
-        report.append("")  # Empty line between months
-    
-    return "\n".join(report)
+        yield "\n"  # Empty line between months
 
 
 def generate_category_report(transactions, category_totals):
@@ -110,40 +134,46 @@ def generate_category_report(transactions, category_totals):
     Returns:
         Formatted report string
     """
+    # Drop the last newline so the text ends like the old "\n".join() output
+    return "".join(_category_report_lines(transactions, category_totals))[:-1]
+
+
+def _category_report_lines(transactions, category_totals):
+    """Yield the lines of the category report, each ending in a newline."""
     if not transactions:
-        return "No transactions to report."
+        yield "No transactions to report.\n"
+        return
     
-    # Organize transactions by category
+    # Organize transactions by category, totalling expenses and income in the same pass
     category_transactions = defaultdict(list)
+    total_expenses = 0.0
+    total_income = 0.0
     for transaction in transactions:
         category_transactions[transaction.category].append(transaction)
+        if transaction.is_expense:
+            total_expenses += transaction.abs_amount
+        else:
+            total_income += transaction.amount
     
     # Generate the report
-    report = []
-    report.append("CATEGORY SPENDING REPORT")
-    report.append("========================\n")
-    
-    # Get total expenses and income
-    total_expenses = sum(abs(t.amount) for t in transactions if t.is_expense)
-    total_income = sum(t.amount for t in transactions if not t.is_expense)
+    yield "CATEGORY SPENDING REPORT\n"
+    yield "========================\n\n"
     
-    report.append(f"Total Income: ${total_income:.2f}")
-    report.append(f"Total Expenses: ${total_expenses:.2f}")
-    report.append("")
+    yield f"Total Income: ${total_income:.2f}\n"
+    yield f"Total Expenses: ${total_expenses:.2f}\n"
+    yield "\n"
     
     # BUG: Category calculations don't separate expenses and income
     # This bug is intentional for the debugging exercise
     
-    # Sort categories by total amount (largest absolute value first)
-    sorted_categories = sorted(
-        category_totals.items(),
-        key=lambda x: abs(x[1]),
-        reverse=True
-    )
+    # Sort categories by total amount (largest absolute value first),
+    # computing each absolute value once rather than on every comparison
+    sorted_categories = [(category, abs(amount), amount) for category, amount in category_totals.items()]
+    sorted_categories.sort(key=itemgetter(1), reverse=True)
     
     # Add category details
-    report.append("BY CATEGORY:")
-    for category, amount in sorted_categories:
+    yield "BY CATEGORY:\n"
+    for category, abs_amount, amount in sorted_categories:
         # Get transactions for this category
         cat_transactions = category_transactions[category]
         transaction_count = len(cat_transactions)
@@ -153,31 +183,29 @@ def generate_category_report(transactions, category_totals):
         
         # Calculate percentage of total
         if is_expense_category and total_expenses > 0:
-            percentage = (abs(amount) / total_expenses) * 100
-            report.append(f"{category}: ${abs(amount):.2f} ({percentage:.1f}% of expenses)")
+            percentage = (abs_amount / total_expenses) * 100
+            yield f"{category}: ${abs_amount:.2f} ({percentage:.1f}% of expenses)\n"
         elif not is_expense_category and total_income > 0:
             percentage = (amount / total_income) * 100
-            report.append(f"{category}: +${amount:.2f} ({percentage:.1f}% of income)")
+            yield f"{category}: +${amount:.2f} ({percentage:.1f}% of income)\n"
         else:
-            report.append(f"{category}: ${abs(amount):.2f}")
+            yield f"{category}: ${abs_amount:.2f}\n"
         
         # Add transaction details for this category
         if transaction_count > 0:
-            report.append(f"  Transactions: {transaction_count}")
+            yield f"  Transactions: {transaction_count}\n"
             
-            # Show most recent transactions (up to 3)
-            recent = sorted(cat_transactions, key=lambda t: t.date, reverse=True)[:3]
+            # Show most recent transactions (up to 3); nlargest is linear per category,
+            # which benchmarks faster than pre-sorting every transaction by date
+            recent = heapq.nlargest(3, cat_transactions, key=attrgetter('date'))
             for transaction in recent:
-                sign = "" if transaction.amount < 0 else "+"
-                report.append(f"  • {transaction.date}: {sign}${abs(transaction.amount):.2f} - {transaction.description}")
+                yield f"  • {transaction.date}: {transaction.sign_char}${transaction.abs_amount:.2f} - {transaction.description}\n"
             
             # If there are more transactions, indicate it
             if transaction_count > 3:
-                report.append(f"  • ... and {transaction_count - 3} more")
+                yield f"  • ... and {transaction_count - 3} more\n"
             
-            report.append("")  # Empty line between categories
-    
-    return "\n".join(report)
+            yield "\n"  # Empty line between categories
 
 
 def generate_savings_report(transactions, start_date, end_date):
@@ -192,15 +220,21 @@ def generate_savings_report(transactions, start_date, end_date):
     Returns:
         Formatted report string
     """
-    # Filter transactions in the date range
-    filtered = [t for t in transactions if start_date <= t.date <= end_date]
-    
-    if not filtered:
+    # Total income and expenses for the date range in a single pass
+    income = 0.0
+    expenses = 0.0
+    found = False
+    for transaction in transactions:
+        if start_date <= transaction.date <= end_date:
+            found = True
+            if transaction.is_expense:
+                expenses += transaction.amount
+            else:
+                income += transaction.amount
+    
+    if not found:
         return f"No transactions found between {start_date} and {end_date}."
     
-    # Calculate income and expenses
-    income = sum(t.amount for t in filtered if not t.is_expense)
-    expenses = sum(t.amount for t in filtered if t.is_expense)
     savings = income + expenses  # expenses are negative, so we add
     
     # Calculate savings rate
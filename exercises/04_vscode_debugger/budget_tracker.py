@@ -41,7 +41,8 @@ class BudgetTracker:
                 reader = csv.DictReader(csvfile)
                 for row in reader:
                     # CSV fields: date, amount, category, description
-                    date = datetime.datetime.strptime(row['date'], '%Y-%m-%d').date()
+                    # fromisoformat parses YYYY-MM-DD in C, far faster than strptime
+                    date = datetime.date.fromisoformat(row['date'])
                     amount = float(row['amount'])
                     category = row['category']
                     description = row['description']
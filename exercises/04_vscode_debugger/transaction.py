@@ -7,10 +7,17 @@ It contains intentional bugs for the VS Code debugging exercise.
 
 import datetime
 from collections import defaultdict
+from functools import lru_cache
+
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+                "August", "September", "October", "November", "December")
 
 class Transaction:
     """Represents a financial transaction."""
     
+    __slots__ = ("date", "amount", "category", "description", "is_expense",
+                 "month", "year", "month_key")
+    
     def __init__(self, date, amount, category, description):
         """
         Initialize a transaction.
@@ -34,10 +41,21 @@ class Transaction:
         self.year = self.date.year
         self.month_key = f"{self.year}-{self.month:02d}"
     
+    @property
+    def abs_amount(self):
+        """The amount without its sign, as shown in the reports."""
+        # Worked out on access so it follows changes to amount made while debugging
+        return abs(self.amount)
+    
+    @property
+    def sign_char(self):
+        """The sign shown before the amount in the reports: '+' for income, '' for expenses."""
+        return "" if self.amount < 0 else "+"
+    
     def __repr__(self):
         """String representation of the transaction."""
         transaction_type = "Expense" if self.is_expense else "Income"
-        return f"{transaction_type}: ${abs(self.amount):.2f} on {self.date} for {self.category} ({self.description})"
+        return f"{transaction_type}: ${self.abs_amount:.2f} on {self.date} for {self.category} ({self.description})"
 
 
 def process_transactions(transactions):
@@ -51,7 +69,8 @@ def process_transactions(transactions):
         Dictionary with 'monthly' and 'categories' totals
     """
     # Initialize data structures for calculations
-    monthly_totals = defaultdict(lambda: {"income": 0, "expenses": 0, "net": 0})
+    # Each month maps to a plain [income, expenses] pair, so a transaction costs one month lookup
+    monthly_sums = {}
     category_totals = defaultdict(float)
     
     # Process each transaction
@@ -59,33 +78,46 @@ def process_transactions(transactions):
         month_key = transaction.month_key
         amount = transaction.amount
         
+        sums = monthly_sums.get(month_key)
+        if sums is None:
+            sums = monthly_sums[month_key] = [0.0, 0.0]
+        
         # BUG: The monthly calculation uses the wrong sign for expenses
         # This bug will be found and fixed during the debugging exercise
         if transaction.is_expense:
-            monthly_totals[month_key]["expenses"] += amount  # Bug: should be += abs(amount)
+            sums[1] += amount  # Bug: should be += abs(amount)
         else:
-            monthly_totals[month_key]["income"] += amount
-        
-        # Calculate monthly net (income - expenses)
-        # BUG: The net calculation is affected by the expense bug
-        monthly_totals[month_key]["net"] = (
-            monthly_totals[month_key]["income"] + monthly_totals[month_key]["expenses"]
-        )
+            sums[0] += amount
         
         # Update category totals
         # BUG: Category calculations don't check for expenses vs income
         category_totals[transaction.category] += amount
     
+    # Build the per-month totals, calculating each month's net (income - expenses) once
+    # BUG: The net calculation is affected by the expense bug
+    monthly_totals = {}
+    for month_key, (income, expenses) in monthly_sums.items():
+        monthly_totals[month_key] = {"income": income, "expenses": expenses, "net": income + expenses}
+    
     # Convert defaultdicts to regular dicts for easier debugging
     return {
-        "monthly": dict(monthly_totals),
+        "monthly": monthly_totals,
         "categories": dict(category_totals)
     }
 
 
 def get_month_name(month_number):
     """Convert a month number (1-12) to a month name."""
-    return datetime.date(2000, month_number, 1).strftime("%B")
+    if not 1 <= month_number <= 12:
+        raise ValueError(f"month must be in 1..12, not {month_number}")
+    return _MONTH_NAMES[month_number - 1]
+
+
+@lru_cache(maxsize=512)
+def parse_month_key(month_key):
+    """Split a 'YYYY-MM' month key into its year string and month name."""
+    year, month = month_key.split('-')
+    return year, get_month_name(int(month))
 
 
 def categorize_transactions(transactions):
@@ -120,9 +152,6 @@ def analyze_spending_trends(transactions, months=3):
     if not transactions:
         return {"trends": {}, "average_monthly_expenses": 0}
     
-    # Get the current date to calculate relative months
-    latest_date = max(t.date for t in transactions)
-    
     # Initialize monthly expense tracking
     monthly_expenses = defaultdict(float)
     
@@ -131,7 +160,7 @@ def analyze_spending_trends(transactions, months=3):
         if transaction.is_expense:
             # Only consider expenses
             month_key = transaction.month_key
-            monthly_expenses[month_key] += abs(transaction.amount)
+            monthly_expenses[month_key] += transaction.abs_amount
     
     # Calculate trends
     trend_data = {}
@@ -141,11 +170,8 @@ def analyze_spending_trends(transactions, months=3):
     actual_months = len(month_keys)
     
     if actual_months >= 2:
-        # Calculate month-to-month changes
-        for i in range(1, actual_months):
-            current_month = month_keys[i]
-            previous_month = month_keys[i-1]
-            
+        # Calculate month-to-month changes over consecutive pairs of months
+        for previous_month, current_month in zip(month_keys, month_keys[1:]):
             current_expenses = monthly_expenses[current_month]
             previous_expenses = monthly_expenses[previous_month]
             
@@ -156,8 +182,7 @@ def analyze_spending_trends(transactions, months=3):
                 change_pct = 0
             
             # Extract month and year from key
-            year, month = current_month.split('-')
-            month_name = get_month_name(int(month))
+            year, month_name = parse_month_key(current_month)
             
             trend_data[current_month] = {
                 "month_name": month_name,
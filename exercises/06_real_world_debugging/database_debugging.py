@@ -12,7 +12,9 @@ already seen in Exercise 1, but focuses exclusively on the data layer.
 import sqlite3
 import time
 import logging
+from collections import Counter
 from contextlib import contextmanager
+from datetime import date
 from typing import List, Dict, Any, Optional, Tuple, Generator
 
 # Configure logging
@@ -28,6 +30,9 @@ DATABASE_PATH = 'taskmanager.db'
 DEFAULT_TIMEOUT = 5.0  # seconds
 MAX_CONNECTIONS = 5
 
+# Task statuses that can no longer become overdue
+_TERMINAL_STATES = frozenset({'completed', 'cancelled'})
+
 # Connection pool (simple implementation)
 connection_pool = []
 
@@ -260,7 +265,7 @@ def assign_tags_to_task(task_id: int, tag_ids: List[int]) -> bool:
         release_connection(connection)
         return True
     except sqlite3.Error as e:
-        logger.error(f"Error assigning tags: {e}")
+        logger.error("Error assigning tags: %s", e)
         cursor.close()
         release_connection(connection)
         return False
@@ -273,35 +278,27 @@ def get_project_statistics(project_id: int) -> Dict[str, Any]:
     # Get all tasks for the project
     tasks = get_project_tasks(project_id)
     
+    # The date doesn't change while counting, so format it only once
+    today = date.today().isoformat()
+    
+    # Count tasks in each category
+    status_counts = Counter(task['status'] for task in tasks)
+    
     # Calculate statistics
     stats = {
         'total_tasks': len(tasks),
-        'pending_tasks': 0,
-        'in_progress_tasks': 0,
-        'completed_tasks': 0,
-        'cancelled_tasks': 0,
-        'high_priority_tasks': 0,
-        'overdue_tasks': 0
+        'pending_tasks': status_counts['pending'],
+        'in_progress_tasks': status_counts['in_progress'],
+        'completed_tasks': status_counts['completed'],
+        'cancelled_tasks': status_counts['cancelled'],
+        'high_priority_tasks': sum(1 for task in tasks if task['priority'] >= 4),
+        # Check which tasks are overdue
+        'overdue_tasks': sum(
+            1 for task in tasks
+            if task['due_date'] and task['due_date'] < today and task['status'] not in _TERMINAL_STATES
+        )
     }
     
-    # Count tasks in each category
-    for task in tasks:
-        if task['status'] == 'pending':
-            stats['pending_tasks'] += 1
-        elif task['status'] == 'in_progress':
-            stats['in_progress_tasks'] += 1
-        elif task['status'] == 'completed':
-            stats['completed_tasks'] += 1
-        elif task['status'] == 'cancelled':
-            stats['cancelled_tasks'] += 1
-        
-        if task['priority'] >= 4:
-            stats['high_priority_tasks'] += 1
-        
-        # Check if task is overdue
-        if task['due_date'] and task['due_date'] < time.strftime('%Y-%m-%d') and task['status'] not in ['completed', 'cancelled']:
-            stats['overdue_tasks'] += 1
-    
     return stats
 
 def perform_database_cleanup() -> None:
@@ -36,6 +36,9 @@ CREATE TABLE tasks (
     due_date TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Denormalized copies of users.username, kept in sync by the triggers below
+    assigned_username TEXT,
+    created_username TEXT,
     FOREIGN KEY (project_id) REFERENCES projects(project_id),
     FOREIGN KEY (assigned_to) REFERENCES users(user_id),
     FOREIGN KEY (created_by) REFERENCES users(user_id)
@@ -106,13 +109,40 @@ CREATE TABLE task_tags (
 );
 
 -- Add indexes for better query performance
-CREATE INDEX idx_tasks_project_id ON tasks(project_id);
+-- Composite indexes also cover the sort (or range) that follows the lookup,
+-- e.g. a project's tasks by due date or a task's comments by time
+CREATE INDEX idx_tasks_project_due ON tasks(project_id, due_date);
 CREATE INDEX idx_tasks_assigned_to ON tasks(assigned_to);
-CREATE INDEX idx_tasks_status ON tasks(status);
+CREATE INDEX idx_tasks_status_updated ON tasks(status, updated_at);
 CREATE INDEX idx_tasks_due_date ON tasks(due_date);
-CREATE INDEX idx_comments_task_id ON comments(task_id);
-CREATE INDEX idx_attachments_task_id ON attachments(task_id);
+CREATE INDEX idx_comments_task_created ON comments(task_id, created_at);
+CREATE INDEX idx_attachments_task_uploaded ON attachments(task_id, uploaded_at);
 CREATE INDEX idx_task_activities_task_id ON task_activities(task_id);
+CREATE INDEX idx_task_activities_created ON task_activities(created_at);
+
+-- Keep the denormalized usernames on tasks in sync, so reads that only need
+-- a username don't have to join users
+CREATE TRIGGER trg_tasks_usernames_insert AFTER INSERT ON tasks
+BEGIN
+    UPDATE tasks
+    SET assigned_username = (SELECT username FROM users WHERE user_id = NEW.assigned_to),
+        created_username = (SELECT username FROM users WHERE user_id = NEW.created_by)
+    WHERE task_id = NEW.task_id;
+END;
+
+CREATE TRIGGER trg_tasks_usernames_update AFTER UPDATE OF assigned_to, created_by ON tasks
+BEGIN
+    UPDATE tasks
+    SET assigned_username = (SELECT username FROM users WHERE user_id = NEW.assigned_to),
+        created_username = (SELECT username FROM users WHERE user_id = NEW.created_by)
+    WHERE task_id = NEW.task_id;
+END;
+
+CREATE TRIGGER trg_users_rename AFTER UPDATE OF username ON users
+BEGIN
+    UPDATE tasks SET assigned_username = NEW.username WHERE assigned_to = NEW.user_id;
+    UPDATE tasks SET created_username = NEW.username WHERE created_by = NEW.user_id;
+END;
 
 -- Insert some sample data
 
@@ -217,3 +247,6 @@ INSERT INTO task_activities (task_id, user_id, action, details) VALUES
 (10, 3, 'created', 'Task created'),
 (10, 3, 'updated', 'Changed status to in_progress'),
 (11, 3, 'created', 'Task created');
+
+-- Collect statistics for the query planner now that the tables have data
+ANALYZE;
@@ -13,10 +13,8 @@ def calculate_average(numbers):
     if not numbers:  # Check if the list is empty
         return 0  # Or return None, or raise a custom exception
     
-    total = 0
-    for num in numbers:
-        total += num
-    return total / len(numbers)
+    # The built-in sum() adds the numbers in C instead of a Python-level loop
+    return sum(numbers) / len(numbers)
 
 # Test Bug 1 Fix
 print("Average test 1:", calculate_average([1, 2, 3, 4, 5]))
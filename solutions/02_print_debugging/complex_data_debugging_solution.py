@@ -6,6 +6,7 @@ using effective print debugging techniques with pretty printing and structured o
 """
 
 import json
+from collections import defaultdict
 from pprint import pprint
 
 # Step 1: Implement a debug helper for complex data structures
@@ -112,7 +113,7 @@ def parse_library_data(api_response):
             'library_name': library['name'],
             'total_books': len(library['books']),
             'available_books': [],
-            'borrowed_books': {},
+            'borrowed_books': defaultdict(list),
             'categories': set()
         }
         
@@ -138,9 +139,6 @@ def parse_library_data(api_response):
                 debug_data(f"Book {book['id']} is borrowed", book['borrowers'])
                 # Store borrower info by user ID
                 for borrower in book['borrowers']:
-                    if borrower['id'] not in result['borrowed_books']:
-                        result['borrowed_books'][borrower['id']] = []
-                    
                     # BUG FIX 1: Include borrower name in the book record
                     # (missing in original code)
                     result['borrowed_books'][borrower['id']].append({
@@ -150,6 +148,9 @@ def parse_library_data(api_response):
                         'borrower_name': borrower['name']  # Add borrower name
                     })
         
+        # Hand back a plain dict so missing user IDs don't silently create entries
+        result['borrowed_books'] = dict(result['borrowed_books'])
+        
         # Convert categories set to sorted list for consistency
         result['categories'] = sorted(list(result['categories']))
         
@@ -6,6 +6,7 @@ application, including conditional breakpoints, post-mortem debugging, and more.
 """
 
 import random
+import shlex
 from datetime import datetime, timedelta
 
 class Task:
@@ -187,151 +188,145 @@ def generate_task_report(manager, include_completed=False):
     return "\n".join(report)
 
 
+# Filters accepted by the list command, mapped to the tasks they select
+LIST_FILTERS = {
+    "all": lambda manager: manager.tasks,
+    "overdue": TaskManager.get_overdue_tasks,
+    "upcoming": TaskManager.get_upcoming_tasks,
+    "high": TaskManager.get_high_priority_tasks,
+}
+
+VALID_SORT_KEYS = frozenset({"priority", "deadline", "created"})
+
+
+def _handle_add(manager, args):
+    """Handle: add "Task name" [priority] [deadline]"""
+    if not args:
+        return "Error: Task name required."
+    
+    # BUG FIX 1: shlex has already grouped a quoted task name into one argument
+    name = args[0]
+    
+    # Parse priority and deadline if provided
+    priority = 3  # Default priority
+    deadline = None
+    
+    if len(args) > 1:
+        try:
+            # BUG FIX 2: Better priority validation
+            priority = int(args[1])
+            if priority < 1 or priority > 5:
+                return "Error: Priority must be 1-5."
+        except ValueError:
+            return "Error: Invalid priority. Must be a number between 1 and 5."
+    
+    if len(args) > 2:
+        try:
+            deadline = datetime.strptime(args[2], "%Y-%m-%d")
+        except ValueError:
+            return "Error: Invalid deadline format. Use YYYY-MM-DD."
+    
+    task = manager.add_task(name, priority, deadline)
+    return f"Added: {task}"
+
+
+def _handle_complete(manager, args):
+    """Handle: complete [task_id]"""
+    if not args:
+        return "Error: Task ID required."
+    
+    try:
+        task_id = int(args[0])
+    except ValueError:
+        return "Error: Invalid task ID."
+    
+    if manager.complete_task(task_id):
+        return f"Marked task {task_id} as completed."
+    else:
+        return f"Error: Task {task_id} not found."
+
+
+def _handle_delete(manager, args):
+    """Handle: delete [task_id]"""
+    if not args:
+        return "Error: Task ID required."
+    
+    try:
+        task_id = int(args[0])
+    except ValueError:
+        return "Error: Invalid task ID."
+    
+    if manager.delete_task(task_id):
+        return f"Deleted task {task_id}."
+    else:
+        return f"Error: Task {task_id} not found."
+
+
+def _handle_list(manager, args):
+    """Handle: list [all|overdue|upcoming|high]"""
+    filter_type = args[0].lower() if args else "all"
+    
+    get_tasks = LIST_FILTERS.get(filter_type)
+    if get_tasks is None:
+        return f"Error: Unknown filter type '{filter_type}'."
+    tasks = get_tasks(manager)
+    
+    if not tasks:
+        return "No tasks found."
+    
+    return "\n".join(str(task) for task in tasks)
+
+
+def _handle_sort(manager, args):
+    """Handle: sort [priority|deadline|created]"""
+    sort_key = args[0].lower() if args else "priority"
+    
+    if sort_key not in VALID_SORT_KEYS:
+        return f"Error: Unknown sort key '{sort_key}'."
+    
+    tasks = manager.sort_tasks(sort_key)
+    
+    if not tasks:
+        return "No tasks found."
+    
+    return "\n".join(str(task) for task in tasks)
+
+
+def _handle_report(manager, args):
+    """Handle: report [all]"""
+    include_completed = bool(args) and args[0].lower() == "all"
+    return generate_task_report(manager, include_completed)
+
+
+# Maps each command name to the function that handles it
+COMMAND_HANDLERS = {
+    "add": _handle_add,
+    "complete": _handle_complete,
+    "delete": _handle_delete,
+    "list": _handle_list,
+    "sort": _handle_sort,
+    "report": _handle_report,
+}
+
+
 def process_command(manager, command):
     """Process a user command for the task manager."""
-    parts = command.split()
+    try:
+        # BUG FIX 1: shlex handles quoted task names such as: add "Buy more milk" 2
+        parts = shlex.split(command)
+    except ValueError as e:
+        return f"Error: Could not parse command: {e}"
     
     if not parts:
         return "No command provided."
     
     action = parts[0].lower()
+    handler = COMMAND_HANDLERS.get(action)
+    if handler is None:
+        return f"Error: Unknown command '{action}'."
     
     try:
-        if action == "add":
-            # Format: add "Task name" [priority] [deadline]
-            if len(parts) < 2:
-                return "Error: Task name required."
-            
-            # BUG FIX 1: Improved task name parsing with quotes
-            # Extract task name (may be in quotes)
-            name = ""
-            name_end_idx = 1
-            
-            # Check if the task name is in quotes
-            if parts[1].startswith('"'):
-                # Find the closing quote
-                full_command = command[len(action):].strip()
-                if '"' in full_command[1:]:
-                    end_quote_pos = full_command[1:].find('"') + 1
-                    name = full_command[1:end_quote_pos]
-                    # Calculate where in parts[] the name ends
-                    remaining = full_command[end_quote_pos + 1:].strip()
-                    name_end_idx = len(parts) - (len(remaining.split()) if remaining else 0) - 1
-                else:
-                    # No closing quote found
-                    name = full_command[1:]
-                    name_end_idx = len(parts) - 1
-            else:
-                # No quotes, just use the next part as the name
-                name = parts[1]
-            
-            # Parse priority and deadline if provided
-            priority = 3  # Default priority
-            deadline = None
-            
-            remaining_parts = parts[name_end_idx + 1:]
-            
-            if remaining_parts and len(remaining_parts) >= 1:
-                try:
-                    # BUG FIX 2: Better priority validation
-                    priority = int(remaining_parts[0])
-                    if priority < 1 or priority > 5:
-                        return "Error: Priority must be 1-5."
-                except ValueError:
-                    return "Error: Invalid priority. Must be a number between 1 and 5."
-            
-            if remaining_parts and len(remaining_parts) >= 2:
-                try:
-                    deadline = datetime.strptime(remaining_parts[1], "%Y-%m-%d")
-                except ValueError:
-                    return "Error: Invalid deadline format. Use YYYY-MM-DD."
-            
-            task = manager.add_task(name, priority, deadline)
-            return f"Added: {task}"
-            
-        elif action == "complete":
-            # Format: complete [task_id]
-            if len(parts) < 2:
-                return "Error: Task ID required."
-            
-            try:
-                task_id = int(parts[1])
-            except ValueError:
-                return "Error: Invalid task ID."
-            
-            if manager.complete_task(task_id):
-                return f"Marked task {task_id} as completed."
-            else:
-                return f"Error: Task {task_id} not found."
-                
-        elif action == "delete":
-            # Format: delete [task_id]
-            if len(parts) < 2:
-                return "Error: Task ID required."
-            
-            try:
-                task_id = int(parts[1])
-            except ValueError:
-                return "Error: Invalid task ID."
-            
-            if manager.delete_task(task_id):
-                return f"Deleted task {task_id}."
-            else:
-                return f"Error: Task {task_id} not found."
-                
-        elif action == "list":
-            # Format: list [all|overdue|upcoming|high]
-            filter_type = parts[1].lower() if len(parts) > 1 else "all"
-            
-            if filter_type == "all":
-                tasks = manager.tasks
-            elif filter_type == "overdue":
-                tasks = manager.get_overdue_tasks()
-            elif filter_type == "upcoming":
-                tasks = manager.get_upcoming_tasks()
-            elif filter_type == "high":
-                tasks = manager.get_high_priority_tasks()
-            else:
-                return f"Error: Unknown filter type '{filter_type}'."
-            
-            if not tasks:
-                return "No tasks found."
-            
-            result = []
-            for task in tasks:
-                result.append(str(task))
-            
-            return "\n".join(result)
-            
-        elif action == "sort":
-            # Format: sort [priority|deadline|created]
-            sort_key = parts[1].lower() if len(parts) > 1 else "priority"
-            
-            if sort_key not in ["priority", "deadline", "created"]:
-                return f"Error: Unknown sort key '{sort_key}'."
-            
-            tasks = manager.sort_tasks(sort_key)
-            
-            if not tasks:
-                return "No tasks found."
-            
-            result = []
-            for task in tasks:
-                result.append(str(task))
-            
-            return "\n".join(result)
-            
-        elif action == "report":
-            # Format: report [include_completed]
-            include_completed = False
-            if len(parts) > 1 and parts[1].lower() == "all":
-                include_completed = True
-            
-            return generate_task_report(manager, include_completed)
-            
-        else:
-            return f"Error: Unknown command '{action}'."
-            
+        return handler(manager, parts[1:])
     except Exception as e:
         # BUG FIX 3: Specific error handling instead of catching all exceptions
         import traceback
@@ -5,6 +5,27 @@ This solution demonstrates how to use Python's built-in debugger (pdb) to find
 and fix bugs in the receipt generator program.
 """
 
+def _to_percentage(discount_percentage):
+    """Convert a discount given as a string (e.g. "25") to a float."""
+    # Adding type checking and conversion
+    if isinstance(discount_percentage, str):
+        try:
+            discount_percentage = float(discount_percentage)
+        except ValueError:
+            raise ValueError("Discount percentage must be a number")
+    return discount_percentage
+
+
+def _to_cents(amount):
+    """Convert a dollar amount to a whole number of cents."""
+    return int(round(amount * 100))
+
+
+def _discount_cents(cents, discount_basis_points):
+    """Apply a discount given in basis points (1/100 of a percent) to cents, rounding half up."""
+    return (cents * (10000 - discount_basis_points) + 5000) // 10000
+
+
 def calculate_discounted_price(prices, discount_percentage):
     """
     Calculate the discounted price for each item in the prices list.
@@ -17,31 +38,16 @@ def calculate_discounted_price(prices, discount_percentage):
         List of discounted prices
     """
     # BUG FIX 1: Convert string discount percentage to float
-    # Adding type checking and conversion
-    if isinstance(discount_percentage, str):
-        try:
-            discount_percentage = float(discount_percentage)
-        except ValueError:
-            raise ValueError("Discount percentage must be a number")
+    discount_percentage = _to_percentage(discount_percentage)
     
     if discount_percentage < 0 or discount_percentage > 100:
         raise ValueError("Discount percentage must be between 0 and 100")
     
-    discounted_prices = []
-    
-    for price in prices:
-        # Calculate discount amount
-        discount_amount = price * discount_percentage / 100
-        
-        # Apply discount
-        discounted_price = price - discount_amount
-        
-        # Round to 2 decimal places
-        discounted_price = round(discounted_price, 2)
-        
-        discounted_prices.append(discounted_price)
-    
-    return discounted_prices
+    # Work in integer cents so the discount is exact and rounds half up,
+    # instead of round() landing on the wrong cent for values like 2.675
+    discount_basis_points = _to_cents(discount_percentage)
+    return [_discount_cents(_to_cents(price), discount_basis_points) / 100
+            for price in prices]
 
 
 def calculate_total(prices):
@@ -54,12 +60,8 @@ def calculate_total(prices):
     Returns:
         Total price
     """
-    total = 0
-    
-    for price in prices:
-        total += price
-    
-    return total
+    # Add whole cents so the total doesn't pick up float error
+    return sum(_to_cents(price) for price in prices) / 100
 
 
 def generate_receipt(items, prices, discount_percentage=0):
@@ -77,6 +79,9 @@ def generate_receipt(items, prices, discount_percentage=0):
     if len(items) != len(prices):
         raise ValueError("Items and prices must have the same length")
     
+    # BUG FIX 1: The discount is also compared below, so convert it here too
+    discount_percentage = _to_percentage(discount_percentage)
+    
     # BUG FIX 2: Handle empty lists
     if not items:
         return "RECEIPT\n----------------------------------------\nNo items\n----------------------------------------\nTotal: $0.00"
@@ -94,11 +99,7 @@ def generate_receipt(items, prices, discount_percentage=0):
     receipt.append("-" * 40)
     
     # Add items
-    for i in range(len(items)):
-        item = items[i]
-        original_price = prices[i]
-        discounted_price = discounted_prices[i]
-        
+    for item, original_price, discounted_price in zip(items, prices, discounted_prices):
         if discount_percentage > 0:
             receipt.append(f"{item}: ${original_price:.2f} -> ${discounted_price:.2f}")
         else:
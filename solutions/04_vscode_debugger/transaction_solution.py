@@ -68,13 +68,6 @@ def process_transactions(transactions):
         else:
             monthly_totals[month_key]["income"] += amount
         
-        # BUG FIX 2: Fix the net calculation formula
-        # Using the Watch panel, we monitored the net calculation and saw the issue
-        # The correct formula is income - expenses (both positive numbers)
-        monthly_totals[month_key]["net"] = (
-            monthly_totals[month_key]["income"] - monthly_totals[month_key]["expenses"]
-        )
-        
         # Update category totals
         # BUG FIX 3: Use absolute values for expense categories
         # Using VS Code's debugger, we set a conditional breakpoint to check expense categories
@@ -85,6 +78,13 @@ def process_transactions(transactions):
             # For income, we store positive values
             category_totals[transaction.category] += amount
     
+    # BUG FIX 2: Fix the net calculation formula
+    # Using the Watch panel, we monitored the net calculation and saw the issue
+    # The correct formula is income - expenses (both positive numbers); it is
+    # worked out once per month after all the totals are in
+    for totals in monthly_totals.values():
+        totals["net"] = totals["income"] - totals["expenses"]
+    
     # Convert defaultdicts to regular dicts for easier debugging
     return {
         "monthly": dict(monthly_totals),
@@ -285,11 +285,7 @@ def logic_error_example3(start, end):
     # Error Type: Logic Error
     # Issue: Off-by-one error
     # Fix: Use range(start, end+1) to include the end value
-    result = []
-    for i in range(start, end + 1):  # Added +1 to include 'end'
-        result.append(i)
-    
-    return result
+    return list(range(start, end + 1))  # Added +1 to include 'end'
 
 # =====================================================================
 # PART 9: Exception Handling
@@ -305,9 +301,7 @@ def exception_handling_example1(data):
     try:
         result = sum(data)
         return result
-    except TypeError:  # Catch specific exception (TypeError for non-iterable)
-        return 0
-    except ValueError:  # Catch another specific possible error
+    except (TypeError, ValueError):  # Catch specific exceptions (TypeError for non-iterable)
         return 0
 
 def exception_handling_example2(filename):
@@ -348,15 +342,16 @@ def circular_reference_example():
     node1 = Node(1)
     node2 = Node(2)
     
-    # Create a reference but avoid the circular reference
+    # Link the nodes both ways, then unlink node2 -> node1 once it is no longer
+    # needed: with no cycle left, reference counting frees both nodes as soon
+    # as the function returns, and Node.next is always a Node or None
     node1.next = node2
-    # Don't create a circular reference
-    # node2.next = node1  # This line was the problem
+    node2.next = node1
+    node2.next = None  # Break the circular reference
     
-    # Alternatively, break the circular reference at the end
+    # Alternatively, don't create the circular reference at all
     # node1.next = node2
-    # node2.next = node1
-    # node2.next = None  # Break the circular reference
+    # node2.next = node1  # This line was the problem
     
     return "Function completed"
 
@@ -9,17 +9,107 @@ and type hinting.
 import os
 import json
 import logging
+import logging.handlers
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, TypeVar, Callable, Set
 from datetime import datetime
+from functools import partial, singledispatch
+
+# Use the faster orjson library when it's installed; the stdlib json module otherwise.
+# Both helpers work with bytes so files can be read and written in binary mode.
+# orjson is imported on first use so that importing this module stays cheap.
+_orjson = None  # The orjson module once imported, or False if it isn't installed
+
+def _get_orjson() -> Any:
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    orjson = _get_orjson()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    # orjson writes non-ASCII text as UTF-8 rather than \u escapes; both are
+    # valid JSON and read back the same. Anything else orjson rejects, such as
+    # ints wider than 64 bits, falls back to the json module.
+    orjson = _get_orjson()
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2).encode()
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted asctime for records in the same second."""
+    
+    _time_cache = (None, "")  # (whole second, formatted time), replaced as one tuple
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
 
 # Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename='data_processor.log'  # Log to a file
+# Records are written straight to the file by default. While a DataProcessor is
+# in use as a context manager, callers only put records on a queue and a
+# background listener thread writes them to the file. Set DP_LOG_UNBUFFERED=1
+# to keep writing every record from the calling thread while debugging.
+_log_file_handler = logging.FileHandler('data_processor.log')  # Log to a file
+_log_file_handler.setFormatter(
+    _CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+logging.basicConfig(level=logging.INFO, handlers=[_log_file_handler])
 logger = logging.getLogger("data_processor")
 
+_log_queue = queue.Queue(-1)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# The file handler applies the full format; the queue only carries the message
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _start_log_listener() -> bool:
+    """Route log records through the background listener.
+    
+    Returns True if this call started the listener, so the caller knows it
+    is responsible for stopping it again.
+    """
+    global _log_listener
+    if _log_listener is not None or os.environ.get('DP_LOG_UNBUFFERED'):
+        return False
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler, respect_handler_level=True)
+    _log_listener.start()
+    root = logging.getLogger()
+    root.removeHandler(_log_file_handler)
+    root.addHandler(_log_queue_handler)
+    return True
+
+def _stop_log_listener() -> None:
+    """Write out every queued record and log to the file directly again."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(_log_queue_handler)
+    root.addHandler(_log_file_handler)
+    # stop() handles everything still on the queue before it returns
+    _log_listener.stop()
+    _log_listener = None
+
 # =====================================================================
 # PART 1: Basic Exception Handling
 # =====================================================================
@@ -45,20 +135,22 @@ def divide_numbers(a: Union[int, float], b: Union[int, float]) -> Optional[float
         logger.warning(f"Invalid types for division: {type(a)}, {type(b)}")
         return None
 
-def parse_json_data(json_string: str) -> Dict[str, Any]:
+def parse_json_data(json_string: Union[str, bytes]) -> Dict[str, Any]:
     """
     Parse a JSON string into a Python dictionary with error handling.
     
     Args:
-        json_string: A string containing JSON data
+        json_string: A string containing JSON data, or the raw UTF-8 bytes
+            read from a file opened in binary mode (parsed without decoding
+            them to a str first)
         
     Returns:
         A dictionary parsed from the JSON string, or empty dict if invalid
     """
     try:
-        data = json.loads(json_string)
+        data = _json_loads(json_string)
         return data
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error(f"Invalid JSON: {e}")
         return {}
 
@@ -111,13 +203,13 @@ def calculate_average(numbers: Optional[List[Union[int, float]]]) -> Optional[fl
         logger.info("calculate_average received empty list")
         return 0
     
-    # Filter out non-numeric elements
-    valid_numbers = []
-    for item in numbers:
-        if isinstance(item, (int, float)):
-            valid_numbers.append(item)
-        else:
-            logger.warning(f"Non-numeric item in list: {item}")
+    # Filter out non-numeric elements, only walking the list again to log them
+    # when something was actually dropped
+    valid_numbers = [item for item in numbers if isinstance(item, (int, float))]
+    if len(valid_numbers) != len(numbers):
+        for item in numbers:
+            if not isinstance(item, (int, float)):
+                logger.warning(f"Non-numeric item in list: {item}")
     
     # Calculate average if we have valid numbers
     if valid_numbers:
@@ -207,6 +299,13 @@ def normalize_and_sort(text_list: Optional[List[str]]) -> List[str]:
         logger.info("normalize_and_sort received empty list")
         return []
     
+    # Fast path: lowercase and sort in C when every item is a string
+    # (str.lower raises TypeError when handed anything else)
+    try:
+        return sorted(map(str.lower, text_list))
+    except TypeError:
+        pass
+    
     # Process valid items and filter out non-strings
     normalized = []
     for i, item in enumerate(text_list):
@@ -232,10 +331,19 @@ def count_lines_in_file(filename: str) -> Union[int, str]:
         Number of lines in the file, or error message if file can't be read
     """
     try:
-        with open(filename, 'r') as file:
-            lines = file.readlines()
-            logger.info(f"Read {len(lines)} lines from {filename}")
-            return len(lines)
+        # Count newlines in fixed-size binary chunks rather than building a str
+        # for every line, so memory use doesn't grow with the file
+        line_count = 0
+        last_chunk = b''
+        with open(filename, 'rb') as file:
+            for chunk in iter(partial(file.read, 1 << 20), b''):
+                line_count += chunk.count(b'\n')
+                last_chunk = chunk
+        # A final line without a trailing newline still counts
+        if last_chunk and not last_chunk.endswith(b'\n'):
+            line_count += 1
+        logger.info(f"Read {line_count} lines from {filename}")
+        return line_count
     except FileNotFoundError:
         logger.error(f"File not found: {filename}")
         return f"Error: File {filename} not found"
@@ -258,29 +366,36 @@ def update_json_file(filename: str, key: str, value: Any) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    # Initialize data with an empty dict
-    data = {}
-    
-    # Try to read existing data if file exists
+    # Update an existing file in place through a single handle: read it, then
+    # rewind and truncate before writing the new contents back. The whole document
+    # is loaded; that is fine for config-sized files, and the stdlib has no
+    # streaming JSON parser to do better for huge ones.
     try:
-        if os.path.exists(filename):
-            with open(filename, 'r') as file:
-                try:
-                    data = json.load(file)
-                    logger.info(f"Loaded existing JSON from {filename}")
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in {filename}, starting with empty data")
-                    # Keep the empty dict
-        else:
-            logger.info(f"File {filename} does not exist, will create new file")
+        with open(filename, 'r+b') as file:
+            try:
+                data = _json_loads(file.read())
+                logger.info(f"Loaded existing JSON from {filename}")
+            except json.JSONDecodeError:
+                logger.warning(f"Invalid JSON in {filename}, starting with empty data")
+                data = {}
+            
+            # Update data
+            data[key] = value
+            
+            # Serialize before truncating so a failure leaves the file untouched
+            payload = _json_dumps(data)
+            file.seek(0)
+            file.truncate()
+            file.write(payload)
+            logger.info(f"Updated {filename} with key {key}")
+        return True
+    except FileNotFoundError:
+        logger.info(f"File {filename} does not exist, will create new file")
     except Exception as e:
-        logger.error(f"Error reading {filename}: {e}")
+        logger.error(f"Error updating {filename}: {e}")
         return False
     
-    # Update data
-    data[key] = value
-    
-    # Write updated data back to file
+    # Create the file with just the new key
     try:
         # Ensure directory exists
         directory = os.path.dirname(filename)
@@ -288,8 +403,8 @@ def update_json_file(filename: str, key: str, value: Any) -> bool:
             os.makedirs(directory)
             logger.info(f"Created directory: {directory}")
         
-        with open(filename, 'w') as file:
-            json.dump(data, file, indent=2)
+        with open(filename, 'wb') as file:
+            file.write(_json_dumps({key: value}))
             logger.info(f"Updated {filename} with key {key}")
         return True
     except Exception as e:
@@ -355,10 +470,14 @@ def merge_dictionaries(dict1: Dict[str, Any],
     
     return result
 
+@singledispatch
 def process_mixed_data(data: Union[str, List[Union[int, float]], Dict[str, Any]]) -> Union[int, float, None]:
     """
     Process data that could be a string, list, or dict.
     
+    The implementation for each supported type is registered below; singledispatch
+    picks it with a cached lookup on type(data) instead of a chain of isinstance checks.
+    
     Args:
         data: Either a string, list of numbers, or dictionary
         
@@ -367,25 +486,32 @@ def process_mixed_data(data: Union[str, List[Union[int, float]], Dict[str, Any]]
         - For lists: the sum of elements (if all are numeric)
         - For dicts: the number of key-value pairs
     """
-    if isinstance(data, str):
-        return len(data)
-    elif isinstance(data, list):
-        # Check if all elements are numeric
-        if all(isinstance(item, (int, float)) for item in data):
-            return sum(data)
-        else:
-            logger.warning("List contains non-numeric elements")
-            return None
-    elif isinstance(data, dict):
-        return len(data)
+    logger.error(f"Unsupported data type: {type(data)}")
+    raise TypeError(f"Unsupported data type: {type(data)}")
+
+@process_mixed_data.register(str)
+def _process_mixed_str(data: str) -> int:
+    return len(data)
+
+@process_mixed_data.register(list)
+def _process_mixed_list(data: List[Union[int, float]]) -> Union[int, float, None]:
+    # Check if all elements are numeric
+    if all(isinstance(item, (int, float)) for item in data):
+        return sum(data)
     else:
-        logger.error(f"Unsupported data type: {type(data)}")
-        raise TypeError(f"Unsupported data type: {type(data)}")
+        logger.warning("List contains non-numeric elements")
+        return None
+
+@process_mixed_data.register(dict)
+def _process_mixed_dict(data: Dict[str, Any]) -> int:
+    return len(data)
 
 # =====================================================================
 # PART 5: Putting It All Together
 # =====================================================================
 
+_MISSING = object()  # Sentinel for keys that are absent from an input item
+
 class DataProcessor:
     """
     A class to process data from multiple sources with robust error handling.
@@ -407,11 +533,23 @@ class DataProcessor:
         self.config: Dict[str, Any] = {}
         self.data_dir: str = ""
         self.processed_data: List[Dict[str, Any]] = []
+        self._paths: Dict[str, str] = {}  # filename -> path inside data_dir
+        self._owns_log_listener = False
         
         # Load configuration
         logger.info(f"Initializing DataProcessor with config: {config_file}")
         self._load_config()
     
+    def __enter__(self) -> 'DataProcessor':
+        self._owns_log_listener = _start_log_listener()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        # Make sure everything logged while processing reaches the log file
+        if self._owns_log_listener:
+            _stop_log_listener()
+        return False
+    
     def _load_config(self) -> None:
         """Load configuration from the config file."""
         try:
@@ -421,8 +559,8 @@ class DataProcessor:
                 raise FileNotFoundError(f"Config file not found: {self.config_file}")
                 
             # Open and parse the config file
-            with open(self.config_file, 'r') as file:
-                self.config = json.load(file)
+            with open(self.config_file, 'rb') as file:
+                self.config = _json_loads(file.read())
                 
             # Validate required configuration
             if 'data_directory' not in self.config:
@@ -434,6 +572,7 @@ class DataProcessor:
                 raise KeyError("Missing 'files' list in config")
                 
             self.data_dir = self.config['data_directory']
+            self._paths.clear()  # Cached paths belong to the previous data_dir
             
             # Ensure data directory exists
             if not os.path.exists(self.data_dir):
@@ -449,6 +588,13 @@ class DataProcessor:
             logger.error(f"Error loading configuration: {e}")
             raise
     
+    def _data_path(self, filename: str) -> str:
+        """Return the path of a file in the data directory, joining it only once."""
+        path = self._paths.get(filename)
+        if path is None:
+            path = self._paths[filename] = os.path.join(self.data_dir, filename)
+        return path
+    
     def load_data_from_file(self, filename: str) -> List[Dict[str, Any]]:
         """
         Load data from a JSON file.
@@ -463,7 +609,7 @@ class DataProcessor:
             FileNotFoundError: If the file doesn't exist
             json.JSONDecodeError: If the file contains invalid JSON
         """
-        file_path = os.path.join(self.data_dir, filename)
+        file_path = self._data_path(filename)
         logger.info(f"Loading data from: {file_path}")
         
         try:
@@ -473,8 +619,8 @@ class DataProcessor:
                 raise FileNotFoundError(f"File not found: {file_path}")
                 
             # Load data from file
-            with open(file_path, 'r') as file:
-                data = json.load(file)
+            with open(file_path, 'rb') as file:
+                data = _json_loads(file.read())
                 
             # Validate that data is a list
             if not isinstance(data, list):
@@ -507,12 +653,12 @@ class DataProcessor:
             logger.error(f"Expected list for results, got {type(results)}")
             raise ValueError(f"Expected list for results, got {type(results)}")
             
-        file_path = os.path.join(self.data_dir, output_file)
+        file_path = self._data_path(output_file)
         logger.info(f"Saving {len(results)} results to: {file_path}")
         
         try:
-            with open(file_path, 'w') as file:
-                json.dump(results, file, indent=2)
+            with open(file_path, 'wb') as file:
+                file.write(_json_dumps(results))
                 
             logger.info(f"Results saved successfully to {output_file}")
             
@@ -531,6 +677,24 @@ class DataProcessor:
         Returns:
             Number of processed items
             
+        Raises:
+            Various exceptions that might occur during processing
+        """
+        results = self._process_file_results(input_file, output_file)
+        self.processed_data.extend(results)
+        return len(results)
+    
+    def _process_file_results(self, input_file: str, output_file: str) -> List[Dict[str, Any]]:
+        """
+        Load, transform and save a single file without touching shared state.
+        
+        Args:
+            input_file: Name of the input file
+            output_file: Name of the output file
+            
+        Returns:
+            The processed items
+            
         Raises:
             Various exceptions that might occur during processing
         """
@@ -554,11 +718,16 @@ class DataProcessor:
                         logger.warning(f"Skipping item without id: {item}")
                         continue
                         
+                    # Look each optional key up once; the sentinel tells "missing" apart
+                    # from a stored None without a separate 'in' check
+                    value = item.get('value', _MISSING)
+                    name = item.get('name', _MISSING)
+                    
                     processed_item = {
                         'id': item['id'],
-                        'value': item.get('value', 0) * 2,
-                        'name': item.get('name', 'UNKNOWN').upper(),
-                        'valid': 'value' in item and 'name' in item,
+                        'value': 0 if value is _MISSING else value * 2,
+                        'name': 'UNKNOWN' if name is _MISSING else name.upper(),
+                        'valid': value is not _MISSING and name is not _MISSING,
                         'processed_at': datetime.now().isoformat()
                     }
                     results.append(processed_item)
@@ -569,10 +738,9 @@ class DataProcessor:
             
             # Save the results
             self.save_results(results, output_file)
-            self.processed_data.extend(results)
             
             logger.info(f"Processed {len(results)} items from {input_file}")
-            return len(results)
+            return results
             
         except FileNotFoundError:
             logger.error(f"Input file not found: {input_file}")
@@ -595,36 +763,48 @@ class DataProcessor:
         logger.info("Processing all files")
         total_processed = 0
         errors = []
+        jobs = []
         
         for file_info in self.config['files']:
-            try:
-                # Validate file_info
-                if not isinstance(file_info, dict):
-                    logger.error(f"Invalid file info: {file_info}")
-                    errors.append(f"Invalid file info: {file_info}")
-                    continue
-                    
-                # Get input and output filenames
-                input_file = file_info.get('input')
-                output_file = file_info.get('output')
-                
-                if not input_file or not output_file:
-                    logger.error(f"Missing input or output in file info: {file_info}")
-                    errors.append(f"Missing input or output in file info: {file_info}")
-                    continue
-                
-                # Process the file
-                count = self.process_file(input_file, output_file)
-                total_processed += count
+            # Validate file_info
+            if not isinstance(file_info, dict):
+                logger.error(f"Invalid file info: {file_info}")
+                errors.append(f"Invalid file info: {file_info}")
+                continue
                 
-            except FileNotFoundError as e:
-                logger.error(f"File not found: {e}")
-                errors.append(str(e))
-                # Continue with other files
-            except Exception as e:
-                logger.error(f"Error processing file: {e}")
-                errors.append(str(e))
-                # Continue with other files
+            # Get input and output filenames
+            input_file = file_info.get('input')
+            output_file = file_info.get('output')
+            
+            if not input_file or not output_file:
+                logger.error(f"Missing input or output in file info: {file_info}")
+                errors.append(f"Missing input or output in file info: {file_info}")
+                continue
+            
+            jobs.append((input_file, output_file))
+        
+        if jobs:
+            # Files are independent, so load/transform/save them on a thread pool to
+            # overlap their I/O; results are collected in config order on this thread
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+                futures = [
+                    executor.submit(self._process_file_results, input_file, output_file)
+                    for input_file, output_file in jobs
+                ]
+                for future in futures:
+                    try:
+                        results = future.result()
+                    except FileNotFoundError as e:
+                        logger.error(f"File not found: {e}")
+                        errors.append(str(e))
+                        # Continue with other files
+                    except Exception as e:
+                        logger.error(f"Error processing file: {e}")
+                        errors.append(str(e))
+                        # Continue with other files
+                    else:
+                        self.processed_data.extend(results)
+                        total_processed += len(results)
         
         # Report results
         logger.info(f"Completed processing {total_processed} items from all files")
@@ -641,7 +821,8 @@ class DataProcessor:
 def create_test_files():
     """Create test files for the exercise."""
     # Create data directory if it doesn't exist
-    os.makedirs("data", exist_ok=True)
+    data_dir = Path("data")
+    data_dir.mkdir(exist_ok=True)
     
     # Create a config file
     config = {
@@ -653,8 +834,7 @@ def create_test_files():
         ]
     }
     
-    with open("data/config.json", "w") as f:
-        json.dump(config, f, indent=2)
+    (data_dir / "config.json").write_bytes(_json_dumps(config))
     
     # Create input files
     input1 = [
@@ -663,8 +843,7 @@ def create_test_files():
         {"id": 3, "name": "Item 3", "value": 30}
     ]
     
-    with open("data/input1.json", "w") as f:
-        json.dump(input1, f, indent=2)
+    (data_dir / "input1.json").write_bytes(_json_dumps(input1))
     
     input2 = [
         {"id": 4, "name": "Item 4", "value": 40},
@@ -672,8 +851,7 @@ def create_test_files():
         {"id": 6, "value": 60}  # Missing name
     ]
     
-    with open("data/input2.json", "w") as f:
-        json.dump(input2, f, indent=2)
+    (data_dir / "input2.json").write_bytes(_json_dumps(input2))
     
     # Third file is intentionally missing to test error handling
     
@@ -689,8 +867,11 @@ def test_functions():
     print(f"10 / 0 = {divide_numbers(10, 0)}")
     
     print("\nTesting parse_json_data:")
-    print(f"Valid JSON: {parse_json_data('{\"key\": \"value\"}')}")
+    valid_json = '{"key": "value"}'
+    valid_json_bytes = b'{"key": "value"}'
+    print(f"Valid JSON: {parse_json_data(valid_json)}")
     print(f"Invalid JSON: {parse_json_data('{key: value}')}")
+    print(f"Valid JSON bytes: {parse_json_data(valid_json_bytes)}")
     
     print("\nTesting get_element_safely:")
     print(f"Get index 1 from [1, 2, 3]: {get_element_safely([1, 2, 3], 1)}")
@@ -757,9 +938,9 @@ def test_functions():
     
     create_test_files()
     try:
-        processor = DataProcessor("data/config.json")
-        print(f"Processing all files: {processor.process_all_files()} items processed")
-        print(f"Processed data count: {len(processor.processed_data)}")
+        with DataProcessor("data/config.json") as processor:
+            print(f"Processing all files: {processor.process_all_files()} items processed")
+            print(f"Processed data count: {len(processor.processed_data)}")
     except Exception as e:
         print(f"Error in DataProcessor: {e}")
 
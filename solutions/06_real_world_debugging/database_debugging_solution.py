@@ -14,12 +14,16 @@ demonstrating fixes for common database-related issues:
 Each fix is documented with a detailed explanation.
 """
 
+import json
 import sqlite3
 import time
 import logging
 import os
+import queue
+import threading
 from contextlib import contextmanager
-from typing import List, Dict, Any, Optional, Tuple, Generator, Union
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, Generator, Iterable, Union
 from datetime import datetime
 
 # Configure logging
@@ -35,244 +39,364 @@ DATABASE_PATH = 'taskmanager.db'
 DEFAULT_TIMEOUT = 5.0  # seconds
 MAX_CONNECTIONS = 5
 MAX_BATCH_SIZE = 1000  # Maximum number of items to process in a batch
+STATEMENT_CACHE_SIZE = 256  # Compiled statements kept per connection
+
+# Applied to every new connection. WAL lets readers run alongside the writer,
+# and synchronous=NORMAL is durable enough in WAL mode while skipping an
+# fsync on every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+)
 
 # FIX #1: Improved connection pooling
 class ConnectionPool:
-    """A simple database connection pool that properly manages connections."""
+    """A bounded SQLite connection pool with a reader/writer split.
+
+    Readers come from a LIFO queue capped at ``max_connections``; all writes go
+    through one long-lived writer connection. Every connection is opened in
+    WAL mode, so readers don't block the writer (or each other) and each
+    call reuses an already-open handle instead of reopening the file.
+    """
     
     def __init__(self, db_path: str, max_connections: int = 5):
         self.db_path = db_path
         self.max_connections = max_connections
-        self.connections = []
-        
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a connection from the pool or create a new one if the pool is empty."""
-        if self.connections:
-            connection = self.connections.pop()
-            
-            # Validate the connection before returning it
-            try:
-                # Execute a simple query to test the connection
-                connection.execute("SELECT 1")
-                return connection
-            except sqlite3.Error as e:
-                # Connection is not valid, close it and create a new one
-                logger.warning(f"Invalid connection from pool: {e}")
-                try:
-                    connection.close()
-                except:
-                    pass
-        
-        # Create a new connection
+        # LIFO hands out the most recently used reader first, whose page and
+        # statement caches are the most likely to still be warm
+        self._readers = queue.LifoQueue(maxsize=max_connections)
+        # Counts reader connections that may still be created
+        self._reader_slots = threading.BoundedSemaphore(max_connections)
+        self._writer = None
+        self._writer_lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and apply the per-connection pragmas."""
         try:
             connection = sqlite3.connect(
                 self.db_path,
                 timeout=DEFAULT_TIMEOUT,
-                detect_types=sqlite3.PARSE_DECLTYPES
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                # Parameterized queries have fixed SQL text, so each one is
+                # compiled once per connection and then reused from this cache
+                cached_statements=STATEMENT_CACHE_SIZE,
+                # The pool guarantees a single owner at a time
+                check_same_thread=False
             )
             connection.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                connection.execute(pragma)
             return connection
         except sqlite3.Error as e:
-            logger.error(f"Error creating database connection: {e}")
+            logger.error("Error creating database connection: %s", e)
             raise
     
+    def get_connection(self, mode: str = 'read') -> sqlite3.Connection:
+        """Get a reader from the pool, or the shared writer when mode is 'write'."""
+        if mode == 'write':
+            if not self._writer_lock.acquire(timeout=DEFAULT_TIMEOUT):
+                raise sqlite3.OperationalError("Timed out waiting for the writer connection")
+            if self._writer is None:
+                try:
+                    self._writer = self._connect()
+                except sqlite3.Error:
+                    self._writer_lock.release()
+                    raise
+            return self._writer
+        
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        
+        # Create a new reader only while the pool is below its limit
+        if self._reader_slots.acquire(blocking=False):
+            try:
+                return self._connect()
+            except sqlite3.Error:
+                self._reader_slots.release()
+                raise
+        
+        # Pool is at its limit, wait for another caller to release a reader
+        try:
+            return self._readers.get(timeout=DEFAULT_TIMEOUT)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a pooled connection")
+    
     def release_connection(self, connection: sqlite3.Connection) -> None:
-        """Return a connection to the pool if it's valid and the pool isn't full."""
+        """Return a connection to the pool after checking it is still usable."""
+        if connection is self._writer:
+            # The writer is shared and long-lived, so a transaction left open
+            # here would be committed by the next, unrelated write
+            if connection.in_transaction:
+                try:
+                    connection.rollback()
+                except sqlite3.Error as e:
+                    logger.error("Error rolling back the writer connection: %s", e)
+            self._writer_lock.release()
+            return
+        
         # FIX #2: Connection validation
         # Validate the connection before returning it to the pool
         try:
             # Check if the connection is still valid
             connection.execute("SELECT 1")
-            
-            # Check if we already have max connections in the pool
-            if len(self.connections) < self.max_connections:
-                self.connections.append(connection)
-            else:
-                # Pool is full, close this connection
-                connection.close()
-        except sqlite3.Error:
-            # Connection is no longer valid, close it
+            self._readers.put_nowait(connection)
+        except (sqlite3.Error, queue.Full):
+            # Connection is no longer valid, close it and free its slot
+            # so a fresh connection can be created next time
             try:
                 connection.close()
-            except:
+            except sqlite3.Error:
                 pass
+            self._reader_slots.release()
     
     def close_all(self) -> None:
         """Close all connections in the pool."""
-        for connection in self.connections:
+        while True:
+            try:
+                connection = self._readers.get_nowait()
+            except queue.Empty:
+                break
             try:
                 connection.close()
-            except:
+            except sqlite3.Error:
                 pass
-        self.connections.clear()
+            self._reader_slots.release()
+        
+        with self._writer_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                except sqlite3.Error:
+                    pass
+                self._writer = None
 
 # Create a global connection pool
 connection_pool = ConnectionPool(DATABASE_PATH, MAX_CONNECTIONS)
 
 @contextmanager
-def db_connection() -> Generator[sqlite3.Connection, None, None]:
+def db_connection(mode: str = 'read') -> Generator[sqlite3.Connection, None, None]:
     """Context manager for database connections."""
-    connection = connection_pool.get_connection()
+    connection = connection_pool.get_connection(mode)
     try:
         yield connection
     finally:
         connection_pool.release_connection(connection)
 
 # FIX #3: Fixed resource leaks in execute_query
-def execute_query(query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
-    """Execute a query and return the results as a list of dictionaries."""
+def execute_query_iter(query: str, params: Tuple = (),
+                       as_dict: bool = False) -> Generator[Union[sqlite3.Row, Dict[str, Any]], None, None]:
+    """Execute a query and yield the results one row at a time.
+    
+    Rows are read from the cursor as they are consumed, so memory use does
+    not grow with the size of the result. The pooled connection is held
+    until the generator is exhausted or closed.
+    
+    Rows are yielded as sqlite3.Row objects, which support ``row['column']``
+    lookups without building a dict; pass as_dict=True when the caller
+    needs to modify the rows or serialize them.
+    """
     # Use context manager to ensure connection is properly released
     with db_connection() as connection:
         cursor = connection.cursor()
+        if as_dict:
+            # Plain tuples are cheaper to build than sqlite3.Row objects when
+            # every row is turned into a dict anyway
+            cursor.row_factory = None
         try:
             cursor.execute(query, params)
-            results = [dict(row) for row in cursor.fetchall()]
-            return results
+            if as_dict:
+                # Read the column names once rather than once per row
+                columns = tuple(column[0] for column in cursor.description)
+                for row in cursor:
+                    yield dict(zip(columns, row))
+            else:
+                yield from cursor
         except sqlite3.Error as e:
-            logger.error(f"Error executing query: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Params: {params}")
+            logger.error("Error executing query: %s", e)
+            logger.error("Query: %s", query)
+            logger.error("Params: %s", params)
             raise
         finally:
             cursor.close()
 
+def execute_query(query: str, params: Tuple = (),
+                  as_dict: bool = False) -> List[Union[sqlite3.Row, Dict[str, Any]]]:
+    """Execute a query and return the results as sqlite3.Row objects, or as
+    dictionaries when as_dict is True."""
+    return list(execute_query_iter(query, params, as_dict))
+
 # FIX #4: Added proper transaction management
 def execute_write(query: str, params: Tuple = ()) -> int:
     """Execute a write operation (INSERT, UPDATE, DELETE) and return affected rows."""
-    with db_connection() as connection:
-        cursor = connection.cursor()
+    with db_connection('write') as connection:
         try:
-            cursor.execute(query, params)
-            connection.commit()
-            affected_rows = cursor.rowcount
-            return affected_rows
+            # Commits on success and rolls back if the statement fails
+            with connection:
+                return connection.execute(query, params).rowcount
         except sqlite3.Error as e:
-            # Roll back the transaction on error
-            connection.rollback()
-            logger.error(f"Error executing write operation: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Params: {params}")
+            logger.error("Error executing write operation: %s", e)
+            logger.error("Query: %s", query)
+            logger.error("Params: %s", params)
             raise
-        finally:
-            cursor.close()
 
 # FIX #5: Added batch size limit to executemany
-def execute_many(query: str, params_list: List[Tuple]) -> int:
-    """Execute a query with multiple parameter sets, with batch size limits."""
-    if not params_list:
+def execute_many(query: str, params_list: Iterable[Tuple]) -> int:
+    """Execute a query with multiple parameter sets, with batch size limits.
+    
+    params_list may be any iterable, including a generator; it is consumed
+    MAX_BATCH_SIZE rows at a time, so only one batch is held in memory.
+    """
+    params_iter = iter(params_list)
+    batch = list(islice(params_iter, MAX_BATCH_SIZE))
+    if not batch:
         return 0
     
     total_affected = 0
     
-    with db_connection() as connection:
-        cursor = connection.cursor()
+    with db_connection('write') as connection:
         try:
+            # Take the write lock up front so all batches share one transaction
+            # (and one commit) instead of failing halfway on a busy database
+            connection.execute("BEGIN IMMEDIATE")
+            
             # Process in batches to avoid memory issues
-            for i in range(0, len(params_list), MAX_BATCH_SIZE):
-                batch = params_list[i:i + MAX_BATCH_SIZE]
-                cursor.executemany(query, batch)
-                total_affected += cursor.rowcount
+            while batch:
+                total_affected += connection.executemany(query, batch).rowcount
+                batch = list(islice(params_iter, MAX_BATCH_SIZE))
             
             connection.commit()
             return total_affected
         except sqlite3.Error as e:
             # Roll back the transaction on error
             connection.rollback()
-            logger.error(f"Error executing batch operation: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Batch size: {len(params_list)}")
+            logger.error("Error executing batch operation: %s", e)
+            logger.error("Query: %s", query)
+            logger.error("Rows processed before the error: %s", total_affected)
+            raise
+        except BaseException:
+            # params_list can raise anything partway through (or the caller
+            # may be interrupted); never leave the shared writer mid-transaction
+            connection.rollback()
             raise
-        finally:
-            cursor.close()
 
 # FIX #6: Fixed SQL injection vulnerability
-def get_user(user_id: int) -> Optional[Dict[str, Any]]:
+# Use parameterized query instead of string formatting
+_GET_USER_SQL = "SELECT * FROM users WHERE user_id = ?"
+
+def get_user(user_id: int) -> Optional[sqlite3.Row]:
     """Get a user by ID."""
-    # Use parameterized query instead of string formatting
-    query = "SELECT * FROM users WHERE user_id = ?"
-    results = execute_query(query, (user_id,))
+    results = execute_query(_GET_USER_SQL, (user_id,))
     return results[0] if results else None
 
-def get_project_tasks(project_id: int) -> List[Dict[str, Any]]:
+# assigned_username is stored on tasks, so no join with users is needed
+_PROJECT_TASKS_SQL = """
+    SELECT t.*
+    FROM tasks t
+    WHERE t.project_id = ?
+    ORDER BY t.due_date
+"""
+
+def get_project_tasks(project_id: int) -> List[sqlite3.Row]:
     """Get all tasks for a project."""
-    query = """
-        SELECT t.*, u.username as assigned_username
-        FROM tasks t
-        LEFT JOIN users u ON t.assigned_to = u.user_id
-        WHERE t.project_id = ?
-        ORDER BY t.due_date
-    """
-    return execute_query(query, (project_id,))
+    return execute_query(_PROJECT_TASKS_SQL, (project_id,))
 
 # FIX #7: Fixed LIKE with parameters
+_SEARCH_TASKS_SQL = """
+    SELECT t.*, p.title as project_title
+    FROM tasks t
+    JOIN projects p ON t.project_id = p.project_id
+    WHERE t.title LIKE ? OR t.description LIKE ?
+    ORDER BY t.due_date
+"""
+
 def search_tasks(search_term: str) -> List[Dict[str, Any]]:
     """Search for tasks matching the search term."""
     # Use parameterized query with proper LIKE parameters
     search_pattern = f"%{search_term}%"
-    query = """
-        SELECT t.*, p.title as project_title, u.username as assigned_username
-        FROM tasks t
-        JOIN projects p ON t.project_id = p.project_id
-        LEFT JOIN users u ON t.assigned_to = u.user_id
-        WHERE t.title LIKE ? OR t.description LIKE ?
-        ORDER BY t.due_date
-    """
-    return execute_query(query, (search_pattern, search_pattern))
+    return execute_query(_SEARCH_TASKS_SQL, (search_pattern, search_pattern), as_dict=True)
 
 # FIX #8: Solved N+1 query problem
+# Fetch the task and all of its related rows in a single query. Each
+# relation is collapsed into a JSON array by a correlated subquery, which
+# avoids the row multiplication a plain JOIN across three one-to-many
+# tables would cause. The task's usernames are stored on tasks itself.
+_TASK_WITH_RELATIONS_SQL = """
+    SELECT t.*, p.title as project_title,
+           (SELECT json_group_array(json_object(
+                       'comment_id', c.comment_id, 'task_id', c.task_id,
+                       'user_id', c.user_id, 'content', c.content,
+                       'created_at', c.created_at, 'username', c.username))
+            FROM (SELECT c.*, u.username
+                  FROM comments c
+                  JOIN users u ON c.user_id = u.user_id
+                  WHERE c.task_id = t.task_id
+                  ORDER BY c.created_at DESC) c) as comments_json,
+           (SELECT json_group_array(json_object(
+                       'attachment_id', a.attachment_id, 'task_id', a.task_id,
+                       'filename', a.filename, 'file_path', a.file_path,
+                       'file_size', a.file_size, 'mime_type', a.mime_type,
+                       'uploaded_by', a.uploaded_by, 'uploaded_at', a.uploaded_at,
+                       'username', a.username))
+            FROM (SELECT a.*, u.username
+                  FROM attachments a
+                  JOIN users u ON a.uploaded_by = u.user_id
+                  WHERE a.task_id = t.task_id
+                  ORDER BY a.uploaded_at DESC) a) as attachments_json,
+           (SELECT json_group_array(json_object(
+                       'tag_id', tg.tag_id, 'name', tg.name, 'color', tg.color))
+            FROM tags tg
+            JOIN task_tags tt ON tg.tag_id = tt.tag_id
+            WHERE tt.task_id = t.task_id) as tags_json
+    FROM tasks t
+    JOIN projects p ON t.project_id = p.project_id
+    WHERE t.task_id = ?
+"""
+
+def _parse_timestamps(rows: List[Dict[str, Any]], column: str) -> None:
+    """Convert the ISO timestamp strings in rows[i][column] to datetimes in place."""
+    for row in rows:
+        if row[column] is not None:
+            row[column] = datetime.fromisoformat(row[column])
+
 def get_task_with_relations(task_id: int) -> Dict[str, Any]:
     """Get a task with all its related data (comments, attachments, etc.)."""
-    # Get the task with its direct relations in a single query
-    task_query = """
-        SELECT t.*, p.title as project_title, 
-               u1.username as created_username,
-               u2.username as assigned_username
-        FROM tasks t
-        JOIN projects p ON t.project_id = p.project_id
-        JOIN users u1 ON t.created_by = u1.user_id
-        LEFT JOIN users u2 ON t.assigned_to = u2.user_id
-        WHERE t.task_id = ?
-    """
-    task_results = execute_query(task_query, (task_id,))
+    # The task dict is extended with its relations below
+    task_results = execute_query(_TASK_WITH_RELATIONS_SQL, (task_id,), as_dict=True)
     if not task_results:
         return {}
     
     task = task_results[0]
     
-    # Get all related data in a single query each instead of in a loop
+    task['comments'] = json.loads(task.pop('comments_json'))
+    task['attachments'] = json.loads(task.pop('attachments_json'))
+    task['tags'] = json.loads(task.pop('tags_json'))
     
-    # Get comments
-    comments_query = """
-        SELECT c.*, u.username
-        FROM comments c
-        JOIN users u ON c.user_id = u.user_id
-        WHERE c.task_id = ?
-        ORDER BY c.created_at DESC
-    """
-    task['comments'] = execute_query(comments_query, (task_id,))
-    
-    # Get attachments
-    attachments_query = """
-        SELECT a.*, u.username
-        FROM attachments a
-        JOIN users u ON a.uploaded_by = u.user_id
-        WHERE a.task_id = ?
-        ORDER BY a.uploaded_at DESC
-    """
-    task['attachments'] = execute_query(attachments_query, (task_id,))
-    
-    # Get tags
-    tags_query = """
-        SELECT t.*
-        FROM tags t
-        JOIN task_tags tt ON t.tag_id = tt.tag_id
-        WHERE tt.task_id = ?
-    """
-    task['tags'] = execute_query(tags_query, (task_id,))
+    # json_object() returns the stored ISO strings; convert them to datetimes
+    # like the TIMESTAMP columns read directly from the task row
+    _parse_timestamps(task['comments'], 'created_at')
+    _parse_timestamps(task['attachments'], 'uploaded_at')
     
     return task
 
 # FIX #9: Added parameter validation for create_task
+_INSERT_TASK_SQL = """
+    INSERT INTO tasks 
+    (title, description, project_id, assigned_to, created_by, status, priority, due_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_TASK_RETURNING_SQL = _INSERT_TASK_SQL + " RETURNING task_id"
+_INSERT_TASK_ACTIVITY_SQL = """
+    INSERT INTO task_activities 
+    (task_id, user_id, action, details)
+    VALUES (?, ?, ?, ?)
+"""
+# INSERT ... RETURNING needs SQLite 3.35+; older builds fall back to lastrowid
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 def create_task(data: Dict[str, Any]) -> int:
     """Create a new task with proper validation."""
     # Validate required fields
@@ -283,7 +407,7 @@ def create_task(data: Dict[str, Any]) -> int:
     
     # Prepare fields with proper NULL handling
     title = data['title']
-    description = data.get('description', '')
+    description = data.get('description')  # Can be None
     project_id = data['project_id']
     assigned_to = data.get('assigned_to')  # Can be None
     created_by = data['created_by']
@@ -292,99 +416,79 @@ def create_task(data: Dict[str, Any]) -> int:
     due_date = data.get('due_date')  # Can be None
     
     # Use context manager to handle the transaction
-    with db_connection() as connection:
-        cursor = connection.cursor()
+    with db_connection('write') as connection:
         try:
-            # Insert the task
-            query = """
-                INSERT INTO tasks 
-                (title, description, project_id, assigned_to, created_by, status, priority, due_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            params = (title, description, project_id, assigned_to, created_by, status, priority, due_date)
-            cursor.execute(query, params)
-            task_id = cursor.lastrowid
-            
-            # Record task creation activity
-            activity_query = """
-                INSERT INTO task_activities 
-                (task_id, user_id, action, details)
-                VALUES (?, ?, ?, ?)
-            """
-            activity_params = (task_id, created_by, 'created', 'Task created')
-            cursor.execute(activity_query, activity_params)
+            # Both inserts commit together or roll back together
+            with connection:
+                # Insert the task
+                params = (title, description, project_id, assigned_to, created_by, status, priority, due_date)
+                if _HAS_RETURNING:
+                    # The new id comes back from the INSERT itself
+                    task_id = connection.execute(_INSERT_TASK_RETURNING_SQL, params).fetchone()[0]
+                else:
+                    task_id = connection.execute(_INSERT_TASK_SQL, params).lastrowid
+                
+                # Record task creation activity
+                activity_params = (task_id, created_by, 'created', 'Task created')
+                connection.execute(_INSERT_TASK_ACTIVITY_SQL, activity_params)
             
-            # Commit the transaction
-            connection.commit()
             return task_id
         except sqlite3.Error as e:
-            # Roll back the transaction on error
-            connection.rollback()
-            logger.error(f"Error creating task: {e}")
+            logger.error("Error creating task: %s", e)
             raise
-        finally:
-            cursor.close()
 
 # FIX #10: Added proper transaction handling for assign_tags_to_task
+_DELETE_TASK_TAGS_SQL = "DELETE FROM task_tags WHERE task_id = ?"
+_INSERT_TASK_TAG_SQL = "INSERT INTO task_tags (task_id, tag_id) VALUES (?, ?)"
+
 def assign_tags_to_task(task_id: int, tag_ids: List[int]) -> bool:
     """Assign multiple tags to a task within a single transaction."""
     if not tag_ids:
         return True  # Nothing to do
     
     # Use a single transaction for all inserts
-    with db_connection() as connection:
-        cursor = connection.cursor()
+    with db_connection('write') as connection:
         try:
-            # First, delete any existing tag assignments
-            cursor.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
-            
-            # Create parameter tuples for batch insert
-            params = [(task_id, tag_id) for tag_id in tag_ids]
-            
-            # Insert all tag assignments at once
-            query = "INSERT INTO task_tags (task_id, tag_id) VALUES (?, ?)"
-            cursor.executemany(query, params)
-            
-            # Commit the transaction
-            connection.commit()
+            # The connection's context manager commits if the block succeeds
+            # and rolls back every statement in it if any of them fails
+            with connection:
+                # First, delete any existing tag assignments
+                connection.execute(_DELETE_TASK_TAGS_SQL, (task_id,))
+                
+                # Insert all tag assignments with one prepared statement
+                connection.executemany(_INSERT_TASK_TAG_SQL, [(task_id, tag_id) for tag_id in tag_ids])
             return True
         except sqlite3.Error as e:
-            # Roll back the transaction on error
-            connection.rollback()
-            logger.error(f"Error assigning tags to task {task_id}: {e}")
+            logger.error("Error assigning tags to task %s: %s", task_id, e)
             return False
-        finally:
-            cursor.close()
 
 # FIX #11: Used SQL aggregation for project statistics
+# Use SQL to calculate statistics directly in the database. Comparisons
+# evaluate to 0 or 1, so SUM() over them counts the matching rows; COALESCE
+# keeps the counts at 0 rather than NULL for a project with no tasks.
+_PROJECT_STATISTICS_SQL = """
+    SELECT 
+        COUNT(*) AS total_tasks,
+        COALESCE(SUM(status = 'pending'), 0) AS pending_tasks,
+        COALESCE(SUM(status = 'in_progress'), 0) AS in_progress_tasks,
+        COALESCE(SUM(status = 'completed'), 0) AS completed_tasks,
+        COALESCE(SUM(status = 'cancelled'), 0) AS cancelled_tasks,
+        COALESCE(SUM(priority >= 4), 0) AS high_priority_tasks,
+        COALESCE(SUM(due_date < date('now') AND status NOT IN ('completed', 'cancelled')), 0) AS overdue_tasks
+    FROM tasks
+    WHERE project_id = ?
+"""
+
 def get_project_statistics(project_id: int) -> Dict[str, Any]:
     """Get statistics about a project's tasks using SQL aggregation."""
-    # Use SQL to calculate statistics directly in the database
-    query = """
-        SELECT 
-            COUNT(*) as total_tasks,
-            SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending_tasks,
-            SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) as in_progress_tasks,
-            SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_tasks,
-            SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) as cancelled_tasks,
-            SUM(CASE WHEN priority >= 4 THEN 1 ELSE 0 END) as high_priority_tasks,
-            SUM(CASE WHEN due_date < date('now') AND status NOT IN ('completed', 'cancelled') THEN 1 ELSE 0 END) as overdue_tasks
-        FROM tasks
-        WHERE project_id = ?
-    """
-    
-    results = execute_query(query, (project_id,))
-    return results[0] if results else {
-        'total_tasks': 0,
-        'pending_tasks': 0,
-        'in_progress_tasks': 0,
-        'completed_tasks': 0,
-        'cancelled_tasks': 0,
-        'high_priority_tasks': 0,
-        'overdue_tasks': 0
-    }
+    # An aggregate without GROUP BY always returns exactly one row
+    return execute_query(_PROJECT_STATISTICS_SQL, (project_id,), as_dict=True)[0]
 
 # FIX #12: Added safeguards for dangerous operations
+_DELETE_OLD_ACTIVITIES_SQL = "DELETE FROM task_activities WHERE created_at < date('now', '-90 days')"
+_ARCHIVE_COMPLETED_TASKS_SQL = "UPDATE tasks SET status = 'archived' WHERE status = 'completed' AND updated_at < date('now', '-30 days')"
+_COUNT_ARCHIVED_ATTACHMENTS_SQL = "SELECT COUNT(*) FROM attachments WHERE task_id IN (SELECT task_id FROM tasks WHERE status = 'archived')"
+
 def perform_database_cleanup(confirm: bool = False) -> Dict[str, int]:
     """Perform database cleanup operations with safeguards and tracking."""
     if not confirm:
@@ -396,37 +500,22 @@ def perform_database_cleanup(confirm: bool = False) -> Dict[str, int]:
         }
     
     # Use a single transaction for all operations
-    with db_connection() as connection:
-        cursor = connection.cursor()
+    with db_connection('write') as connection:
         try:
-            # Get counts before deletion for reporting
-            cursor.execute("SELECT COUNT(*) FROM task_activities WHERE created_at < date('now', '-90 days')")
-            old_activities_count = cursor.fetchone()[0]
-            
-            # Delete old activities (older than 90 days)
-            cursor.execute(
-                "DELETE FROM task_activities WHERE created_at < date('now', '-90 days')"
-            )
-            
-            # Archive completed tasks older than 30 days
-            cursor.execute(
-                "SELECT COUNT(*) FROM tasks WHERE status = 'completed' AND updated_at < date('now', '-30 days')"
-            )
-            archived_tasks_count = cursor.fetchone()[0]
-            
-            cursor.execute(
-                "UPDATE tasks SET status = 'archived' WHERE status = 'completed' AND updated_at < date('now', '-30 days')"
-            )
-            
-            # Instead of deleting attachments, just get a count of what would be deleted
-            # This is a safer approach - actual deletion should be a separate, deliberate operation
-            cursor.execute(
-                "SELECT COUNT(*) FROM attachments WHERE task_id IN (SELECT task_id FROM tasks WHERE status = 'archived')"
-            )
-            attachments_count = cursor.fetchone()[0]
-            
-            # Commit the transaction
-            connection.commit()
+            # Either every step below is applied or, if any of them fails,
+            # none are
+            with connection:
+                # Delete old activities (older than 90 days)
+                # rowcount reports the affected rows, so there's no need for
+                # a separate COUNT(*) query before each change
+                old_activities_count = connection.execute(_DELETE_OLD_ACTIVITIES_SQL).rowcount
+                
+                # Archive completed tasks older than 30 days
+                archived_tasks_count = connection.execute(_ARCHIVE_COMPLETED_TASKS_SQL).rowcount
+                
+                # Instead of deleting attachments, just get a count of what would be deleted
+                # This is a safer approach - actual deletion should be a separate, deliberate operation
+                attachments_count = connection.execute(_COUNT_ARCHIVED_ATTACHMENTS_SQL).fetchone()[0]
             
             return {
                 'status': 'success',
@@ -435,32 +524,43 @@ def perform_database_cleanup(confirm: bool = False) -> Dict[str, int]:
                 'attachments_to_review': attachments_count  # We don't delete them automatically
             }
         except sqlite3.Error as e:
-            # Roll back the transaction on error
-            connection.rollback()
-            logger.error(f"Error during database cleanup: {e}")
+            logger.error("Error during database cleanup: %s", e)
             return {
                 'status': 'error',
                 'reason': str(e)
             }
-        finally:
-            cursor.close()
 
 # FIX #13: Optimized duplicate task detection
+# Use a SQL query to find potential duplicates
+# This avoids loading all tasks into memory and doing O(n²) comparisons.
+# The GROUP BY finds the duplicated titles in one pass; only the tasks
+# carrying one of them are then paired up, and SQLite joins that small
+# set through an automatic index on the lowered title.
+# On large tables, an expression index also speeds up the first step:
+#   CREATE INDEX idx_tasks_title_lower ON tasks(lower(title));
+_DUPLICATE_TASKS_SQL = """
+    WITH candidates AS (
+        SELECT task_id, title, lower(title) AS title_key
+        FROM tasks
+        WHERE lower(title) IN (
+            SELECT lower(title)
+            FROM tasks
+            GROUP BY lower(title)
+            HAVING COUNT(*) > 1
+        )
+    )
+    SELECT t1.task_id as task1_id, t1.title as task1_title,
+           t2.task_id as task2_id, t2.title as task2_title
+    FROM candidates t1
+    JOIN candidates t2 ON t1.title_key = t2.title_key
+                      AND t1.task_id < t2.task_id  -- Ensure we only get each pair once
+    ORDER BY t1.task_id, t2.task_id
+    LIMIT 100  -- Limit results to prevent excessive data
+"""
+
 def find_duplicate_tasks() -> List[Dict[str, Any]]:
     """Find potential duplicate tasks based on title similarity using SQL."""
-    # Use a SQL query to find potential duplicates
-    # This avoids loading all tasks into memory and doing O(n²) comparisons
-    query = """
-        SELECT t1.task_id as task1_id, t1.title as task1_title,
-               t2.task_id as task2_id, t2.title as task2_title
-        FROM tasks t1
-        JOIN tasks t2 ON t1.task_id < t2.task_id  -- Ensure we only get each pair once
-        WHERE lower(t1.title) = lower(t2.title)   -- Case-insensitive comparison
-        ORDER BY t1.task_id
-        LIMIT 100  -- Limit results to prevent excessive data
-    """
-    
-    return execute_query(query)
+    return execute_query(_DUPLICATE_TASKS_SQL, as_dict=True)
 
 # Performance measurement decorator
 def measure_performance(f):
@@ -469,7 +569,7 @@ def measure_performance(f):
         start_time = time.time()
         result = f(*args, **kwargs)
         end_time = time.time()
-        logger.info(f"Function {f.__name__} took {end_time - start_time:.4f} seconds to execute")
+        logger.info("Function %s took %.4f seconds to execute", f.__name__, end_time - start_time)
         return result
     return wrapper
 
@@ -543,9 +643,106 @@ def init_db():
     finally:
         conn.close()
 
+# Indexes the queries in this module rely on. New databases get them from
+# schema.sql; ensure_indexes() adds them to ones created from an older schema.
+QUERY_INDEXES = {
+    'idx_tasks_project_due': "CREATE INDEX IF NOT EXISTS idx_tasks_project_due ON tasks(project_id, due_date)",
+    'idx_tasks_status_updated': "CREATE INDEX IF NOT EXISTS idx_tasks_status_updated ON tasks(status, updated_at)",
+    'idx_comments_task_created': "CREATE INDEX IF NOT EXISTS idx_comments_task_created ON comments(task_id, created_at)",
+    'idx_attachments_task_uploaded': "CREATE INDEX IF NOT EXISTS idx_attachments_task_uploaded ON attachments(task_id, uploaded_at)",
+    'idx_task_activities_created': "CREATE INDEX IF NOT EXISTS idx_task_activities_created ON task_activities(created_at)",
+}
+
+# Denormalized username columns on tasks, and the triggers that keep them in
+# step with users. Like the indexes, older databases are upgraded in place.
+USERNAME_COLUMNS = {
+    'assigned_username': 'assigned_to',
+    'created_username': 'created_by',
+}
+USERNAME_TRIGGERS = {
+    'trg_tasks_usernames_insert': """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_usernames_insert AFTER INSERT ON tasks
+        BEGIN
+            UPDATE tasks
+            SET assigned_username = (SELECT username FROM users WHERE user_id = NEW.assigned_to),
+                created_username = (SELECT username FROM users WHERE user_id = NEW.created_by)
+            WHERE task_id = NEW.task_id;
+        END""",
+    'trg_tasks_usernames_update': """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_usernames_update AFTER UPDATE OF assigned_to, created_by ON tasks
+        BEGIN
+            UPDATE tasks
+            SET assigned_username = (SELECT username FROM users WHERE user_id = NEW.assigned_to),
+                created_username = (SELECT username FROM users WHERE user_id = NEW.created_by)
+            WHERE task_id = NEW.task_id;
+        END""",
+    'trg_users_rename': """
+        CREATE TRIGGER IF NOT EXISTS trg_users_rename AFTER UPDATE OF username ON users
+        BEGIN
+            UPDATE tasks SET assigned_username = NEW.username WHERE assigned_to = NEW.user_id;
+            UPDATE tasks SET created_username = NEW.username WHERE created_by = NEW.user_id;
+        END""",
+}
+_indexes_checked = False
+
+def _ensure_username_columns(connection: sqlite3.Connection, existing: set) -> List[str]:
+    """Add and backfill the tasks username columns if the database predates them.
+    
+    Returns the names of the columns that were added.
+    """
+    task_columns = {row['name'] for row in connection.execute("PRAGMA table_info(tasks)")}
+    added = [column for column in USERNAME_COLUMNS if column not in task_columns]
+    for column in added:
+        connection.execute(f"ALTER TABLE tasks ADD COLUMN {column} TEXT")
+    if added:
+        assignments = ", ".join(
+            f"{column} = (SELECT username FROM users WHERE user_id = tasks.{id_column})"
+            for column, id_column in USERNAME_COLUMNS.items()
+        )
+        connection.execute(f"UPDATE tasks SET {assignments}")
+        logger.info("Added and backfilled tasks columns: %s", ", ".join(added))
+    
+    for name, sql in USERNAME_TRIGGERS.items():
+        if name not in existing:
+            connection.execute(sql)
+    return added
+
+def ensure_indexes() -> None:
+    """Upgrade an older database to the schema the queries in this module expect.
+    
+    Adds the denormalized username columns and their triggers, creates any
+    missing query indexes and makes sure the planner has statistics.
+    Only the first call in a process does any work.
+    """
+    global _indexes_checked
+    if _indexes_checked:
+        return
+    
+    with db_connection('write') as connection:
+        existing = {
+            row['name'] for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('index', 'table', 'trigger')"
+            )
+        }
+        added_columns = _ensure_username_columns(connection, existing)
+        
+        missing = [sql for name, sql in QUERY_INDEXES.items() if name not in existing]
+        for sql in missing:
+            connection.execute(sql)
+        
+        # ANALYZE fills sqlite_stat1, which the query planner uses to choose
+        # between indexes; it only needs to run again when the schema changed
+        if missing or added_columns or 'sqlite_stat1' not in existing:
+            connection.execute("ANALYZE")
+            logger.info("Created %s missing indexes and ran ANALYZE", len(missing))
+        connection.commit()
+    
+    _indexes_checked = True
+
 if __name__ == "__main__":
     # Initialize the database if needed (uncomment to initialize)
     # init_db()
+    ensure_indexes()
     
     # Run the demos
     print("\n=== Basic Operations ===")
@@ -564,12 +761,14 @@ Solution Explanations:
 
 1. Improper Connection Pooling (Bug #1)
    - Problem: The connection pool implementation didn't properly manage pool size or validate connections.
-   - Fix: Created a ConnectionPool class with proper initialization, validation, and connection management.
+   - Fix: Created a ConnectionPool class that bounds the number of reader connections with a queue,
+     routes writes through a single writer connection, and opens every connection in WAL mode.
    - Why it matters: Proper connection pooling is essential for database performance and resource management.
 
 2. No Connection Validation (Bug #2)
    - Problem: Connections weren't validated before reuse, potentially leading to errors when using stale connections.
-   - Fix: Added validation checks for connections before returning them to the pool or reusing them.
+   - Fix: Connections are validated before they go back to the pool; broken ones are closed and
+     their slot freed so a fresh connection can be created.
    - Why it matters: Invalid connections can cause application errors and resource leaks.
 
 3. Resource Leak in execute_query (Bug #3)
@@ -599,7 +798,8 @@ Solution Explanations:
 
 8. N+1 Query Problem (Bug #8)
    - Problem: Fetching related data with separate queries for each item, causing performance issues.
-   - Fix: Used more efficient querying with JOINs and reduced the number of database calls.
+   - Fix: Fetched the task and its comments, attachments and tags in one query, aggregating each
+     relation into a JSON array with json_group_array.
    - Why it matters: N+1 queries dramatically reduce application performance as data volume grows.
 
 9. Incorrect Parameter Handling (Bug #9)
@@ -633,4 +833,6 @@ Additional Improvements:
 3. Enhanced transaction management with proper commits and rollbacks
 4. Added better error messages and diagnostic information
 5. Implemented proper resource cleanup
+6. Read task usernames from the denormalized tasks columns (kept in sync by triggers in schema.sql)
+   instead of joining users on every task query; ensure_indexes() adds them to older databases
 """